@@ -1,5 +1,121 @@
+import time
+import weakref
+from contextlib import contextmanager
+
 import wx
 
+# Animation policy states (see AnimationPolicy)
+ACTIVE = "active"          # frame visible and focused: full frame rate
+UNFOCUSED = "unfocused"    # visible but another window has focus: throttled
+HIDDEN = "hidden"          # minimised or hidden: decorative timers paused
+
+UNFOCUSED_MIN_MS = 100     # ~10 FPS cap for decorative animation while unfocused
+TRANSITION_MS = 240        # PageTransition slide length
+
+
+class AnimationPolicy:
+    """
+    App-wide throttle for decorative animation timers.
+
+    MainFrame feeds it EVT_ICONIZE / EVT_ACTIVATE / EVT_SHOW via attach();
+    every AnimationTimer re-applies the current state when it changes.
+    Functional timers (Pomodoro countdown, clocks) stay plain wx.Timers.
+    """
+
+    def __init__(self):
+        self.state = ACTIVE
+        self.timers = weakref.WeakSet()
+        self.tick_hook = None      # callable(owner) per AnimationTimer tick (PerfHUD)
+
+    def attach(self, frame):
+        frame.Bind(wx.EVT_ICONIZE, lambda e: self._on_frame_event(frame, e))
+        frame.Bind(wx.EVT_ACTIVATE, lambda e: self._on_frame_event(frame, e))
+        frame.Bind(wx.EVT_SHOW, lambda e: self._on_frame_event(frame, e))
+
+    def _on_frame_event(self, frame, evt):
+        if isinstance(evt, wx.IconizeEvent):
+            iconized = evt.IsIconized()
+        else:
+            iconized = frame.IsIconized()
+
+        if iconized or not frame.IsShown():
+            self.set_state(HIDDEN)
+        elif isinstance(evt, wx.ActivateEvent):
+            self.set_state(ACTIVE if evt.GetActive() else UNFOCUSED)
+        else:
+            self.set_state(ACTIVE if frame.IsActive() else UNFOCUSED)
+        evt.Skip()
+
+    def set_state(self, state):
+        if state == self.state:
+            return
+        self.state = state
+        for timer in list(self.timers):
+            timer.apply()
+
+    def interval_for(self, ms):
+        """Effective interval for a requested one, or None while paused."""
+        if self.state == HIDDEN:
+            return None
+        if self.state == UNFOCUSED:
+            return max(ms, UNFOCUSED_MIN_MS)
+        return ms
+
+
+animation_policy = AnimationPolicy()
+
+
+class AnimationTimer(wx.Timer):
+    """
+    wx.Timer for decorative animation. Start()/Stop() keep their usual
+    meaning; the interval actually used follows animation_policy, so the
+    timer pauses while the app is hidden and slows while it is unfocused.
+    Tick handlers that integrate motion should scale by GetInterval().
+    """
+
+    def __init__(self, owner, id=wx.ID_ANY):
+        super().__init__(owner, id)
+        self.owner = owner
+        self.requested_ms = 0
+        self.wanted = False
+        animation_policy.timers.add(self)
+
+    def Start(self, milliseconds=-1, oneShot=wx.TIMER_CONTINUOUS):
+        if oneShot:
+            # one-shot delays are not animation frames; leave them alone
+            return super().Start(milliseconds, oneShot)
+        if milliseconds > 0:
+            self.requested_ms = milliseconds
+        self.wanted = True
+        return self.apply()
+
+    def Stop(self):
+        self.wanted = False
+        super().Stop()
+
+    def Notify(self):
+        hook = animation_policy.tick_hook
+        if hook is not None:
+            hook(self.owner)
+        super().Notify()      # sends EVT_TIMER to the owner as usual
+
+    def apply(self):
+        if not self.owner:
+            # owner window destroyed: never touch this timer again
+            self.wanted = False
+            animation_policy.timers.discard(self)
+            return False
+        if not self.wanted:
+            return False
+
+        ms = animation_policy.interval_for(self.requested_ms)
+        if ms is None:
+            super().Stop()
+            return True
+        if not self.IsRunning() or self.GetInterval() != ms:
+            return super().Start(ms)
+        return True
+
 
 class TextAnimator:
     """Simple slide-in text animator."""
@@ -54,62 +170,234 @@ class TextAnimator:
         self.current_step += 1
 
 
-class PageTransition:
-    """Panel-based slide transition (covers screen right→left→off)."""
+# --------------------------------------------------------------------
+# Offscreen rendering of a widget tree (PageTransition snapshots)
+# --------------------------------------------------------------------
+_PAINT_DCS = ("PaintDC", "BufferedPaintDC", "AutoBufferedPaintDC")
 
-    def __init__(self, parent_panel: wx.Panel, size):
-        self.parent = parent_panel
-        self.width, self.height = size
 
-        self.panel = wx.Panel(parent_panel, size=size)
-        self.panel.SetBackgroundColour(wx.BLACK)
-        self.panel.Hide()
+@contextmanager
+def _paint_into(window, dc):
+    """While active, paint DCs created for `window` are `dc` instead."""
+    saved = {name: getattr(wx, name) for name in _PAINT_DCS}
 
-        self.state = "idle"
+    def redirect(original):
+        def make(win, *args, **kwargs):
+            if win is window:
+                return dc
+            return original(win, *args, **kwargs)
+        return make
+
+    for name, original in saved.items():
+        setattr(wx, name, redirect(original))
+    try:
+        yield
+    finally:
+        for name, original in saved.items():
+            setattr(wx, name, original)
+
+
+def _send_paint(win):
+    try:
+        evt = wx.PaintEvent(win)
+    except TypeError:             # wxPython 4.0: PaintEvent(id)
+        evt = wx.PaintEvent(win.GetId())
+    evt.SetEventObject(win)
+    win.GetEventHandler().ProcessEvent(evt)
+
+
+def _draw_native(win, dc, w, h):
+    """Close stand-in for a natively drawn window: background, bitmap or text."""
+    if not isinstance(win, wx.Control) or win.UseBackgroundColour():
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.SetBrush(wx.Brush(win.GetBackgroundColour()))
+        dc.DrawRectangle(0, 0, w, h)
+    if not isinstance(win, wx.Control):
+        return
+
+    if isinstance(win, wx.StaticBitmap):
+        bmp = win.GetBitmap()
+        if bmp.IsOk():
+            dc.DrawBitmap(bmp, 0, 0, True)
+        return
+
+    dc.SetFont(win.GetFont())
+    dc.SetTextForeground(win.GetForegroundColour())
+    if isinstance(win, wx.TextCtrl):
+        dc.DrawText(win.GetValue(), 4, 4)
+    elif isinstance(win, wx.StaticText):
+        dc.DrawText(win.GetLabel(), 0, 0)
+    else:
+        dc.DrawLabel(win.GetLabel(), wx.Rect(0, 0, w, h), wx.ALIGN_CENTER)
+
+
+class PageTransition(wx.Window):
+    """
+    Composited slide between two screens of the parent frame.
+
+    start(swap) renders what the parent shows now into a bitmap and covers
+    the frame with it, lets swap() replace the real widgets underneath,
+    then (once the incoming screen's deferred sizing has run) lays the new
+    tree out and renders it too. The two pictures slide as a single paint
+    of this covering window; only when the slide ends is the cover hidden
+    and the real widget tree revealed.
+
+    Nothing is read back from the display, so this works on every port and
+    the incoming screen never reaches the screen early: custom-painted
+    windows (BG_STYLE_PAINT) run their own paint handlers into a MemoryDC,
+    the way benchmarks/paint_bench.py drives them. Native controls cannot
+    be drawn offscreen portably, so they are approximated by their
+    background colour, bitmap or text — close enough for a 240 ms slide.
+    """
+
+    def __init__(self, parent, size, duration_ms=TRANSITION_MS):
+        super().__init__(parent, pos=(0, 0), size=size, style=wx.BORDER_NONE)
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.Bind(wx.EVT_PAINT, self._on_paint)
+        self.Hide()
+
+        self.width, self.height = size
+        self.duration = duration_ms / 1000
+        self.state = "idle"          # idle → capture → slide → idle
+        self.direction = 1
+        self.old = self.new = None
+        self.t0 = 0.0
+        self.progress = 0.0
         self.callback = None
 
-        self.x = self.width
-        self.speed = 40  # pixels per frame
+        self.timer = AnimationTimer(self)
+        self.Bind(wx.EVT_TIMER, self._on_timer, self.timer)
+
+    # ---------------------------------------------------------
+    # Snapshots
+    # ---------------------------------------------------------
+    def snapshot(self):
+        """Offscreen picture of the parent's client area and shown children."""
+        bmp = wx.Bitmap(self.width, self.height)
+        mem = wx.MemoryDC(bmp)
+        self._render(self.GetParent(), mem)
+        mem.SelectObject(wx.NullBitmap)
+        return bmp
+
+    def _render(self, win, dc):
+        """Draw win, in its own client coordinates, and its shown children into dc."""
+        w, h = win.GetClientSize()
+        if win.GetBackgroundStyle() == wx.BG_STYLE_PAINT:
+            with _paint_into(win, dc):
+                _send_paint(win)
+        else:
+            _draw_native(win, dc, w, h)
+
+        for child in win.GetChildren():
+            if child is self or not child.IsShown() or child.IsTopLevel():
+                continue
+            x, y = child.GetPosition()
+            cw, ch = child.GetSize()
+            rect = wx.Rect(x, y, cw, ch).Intersect(wx.Rect(0, 0, w, h))
+            if rect.IsEmpty():
+                continue
 
-        self.timer = wx.Timer(parent_panel)
-        parent_panel.Bind(wx.EVT_TIMER, self._on_timer, self.timer)
+            bmp = wx.Bitmap(rect.width, rect.height)
+            mem = wx.MemoryDC(bmp)
+            # start from what lies behind, for transparent children
+            mem.Blit(0, 0, rect.width, rect.height, dc, rect.x, rect.y)
+            mem.SetDeviceOrigin(x - rect.x, y - rect.y)
+            self._render(child, mem)
+            mem.SetDeviceOrigin(0, 0)
+            dc.Blit(rect.x, rect.y, rect.width, rect.height, mem, 0, 0)
+            mem.SelectObject(wx.NullBitmap)
 
-    def start(self, callback):
-        """Start transition and call callback in the middle."""
+    def _layout(self, win):
+        if win.GetSizer():
+            win.Layout()
+        for child in win.GetChildren():
+            if child is not self and child.IsShown() and not child.IsTopLevel():
+                self._layout(child)
+
+    # ---------------------------------------------------------
+    # Transition
+    # ---------------------------------------------------------
+    def start(self, swap, direction=1, callback=None):
+        """
+        Run swap() behind a slide. direction 1 slides towards the left
+        (forward), -1 towards the right (back). callback runs once the
+        real widgets are revealed.
+        """
         if self.state != "idle":
+            self.finish()
+        parent = self.GetParent()
+        if not parent.IsShownOnScreen() or parent.IsIconized():
+            swap()
+            if callable(callback):
+                callback()
+            return
+
+        try:
+            self.old = self.snapshot()
+        except Exception as e:
+            print("Transition snapshot error:", e)
+            swap()
+            if callable(callback):
+                callback()
             return
 
+        self.new = None
+        self.direction = direction
         self.callback = callback
-        self.state = "enter"
-        self.x = self.width  # start just outside right
-        self.panel.SetPosition((self.x, 0))
-        self.panel.Show()
+        self.progress = 0.0
+        self.state = "capture"
+        self.Show()                  # outgoing picture covers the swap
+        self.Raise()
+        self.Update()
+
+        swap()
+        # queued behind the incoming screen's own CallAfter sizing
+        wx.CallAfter(self._capture_incoming)
+
+    def _capture_incoming(self):
+        if not self or self.state != "capture":
+            return
+        parent = self.GetParent()
+        try:
+            # the cover stays up: the incoming tree is only rendered offscreen
+            self._layout(parent)
+            self.new = self.snapshot()
+        except Exception as e:
+            print("Transition snapshot error:", e)
+            self.finish()
+            return
+        self.Raise()
+
+        self.state = "slide"
+        self.t0 = time.perf_counter()
         self.timer.Start(16)
 
+    def finish(self):
+        """Jump to the end: hide the cover and reveal the real widgets."""
+        self.timer.Stop()
+        self.Hide()
+        self.old = self.new = None
+        self.state = "idle"
+        callback, self.callback = self.callback, None
+        if callable(callback):
+            callback()
+
     def _on_timer(self, event):
-        if event.GetTimer() is not self.timer:
-            event.Skip()
+        # time-based, so throttled or paused frames only drop, never slow it
+        t = min(1.0, (time.perf_counter() - self.t0) / self.duration)
+        self.progress = 1 - (1 - t) ** 3
+        if t >= 1:
+            self.finish()
             return
+        self.Refresh(False)
 
-        if self.state == "enter":
-            self.x -= self.speed
-            if self.x <= 0:
-                self.x = 0
-                self.panel.SetPosition((self.x, 0))
-                # Call the provided callback once fully covered
-                if callable(self.callback):
-                    self.callback()
-                self.state = "exit"
-            else:
-                self.panel.SetPosition((self.x, 0))
-
-        elif self.state == "exit":
-            self.x -= self.speed
-            if self.x <= -self.width:
-                self.x = -self.width
-                self.panel.Hide()
-                self.timer.Stop()
-                self.state = "idle"
-                self.callback = None
-            else:
-                self.panel.SetPosition((self.x, 0))
+    def _on_paint(self, event):
+        dc = wx.AutoBufferedPaintDC(self)
+        if self.old is None:
+            return
+        if self.new is None:
+            dc.DrawBitmap(self.old, 0, 0)
+            return
+        x = int(self.width * self.progress) * self.direction
+        dc.DrawBitmap(self.old, -x, 0)
+        dc.DrawBitmap(self.new, self.width * self.direction - x, 0)
@@ -0,0 +1,91 @@
+# ================================================================
+#   StudyAura — PIL → wx.Bitmap conversion cost
+# ================================================================
+"""
+Times icon_button.pil_to_wx_bitmap against the wx.Image route it
+replaced (kept below as legacy_pil_to_wx_bitmap) on the home background
+scaled to the 1550x800 design size, the largest bitmap built at startup.
+
+    xvfb-run -a python benchmarks/bitmap_bench.py
+    xvfb-run -a python benchmarks/bitmap_bench.py --runs 100 --size 3100 1600
+
+Peak Python allocations per conversion come from tracemalloc and cover
+the intermediate byte strings, not the bitmap memory owned by wx.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import wx
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from icon_button import pil_to_wx_bitmap  # noqa: E402
+
+BACKGROUND = os.path.join(ROOT, "assets", "icons", "background.png")
+
+
+# ----------------------------------------------------------------
+# Reference: pil_to_wx_bitmap before the buffer path
+# ----------------------------------------------------------------
+def legacy_pil_to_wx_bitmap(pil_img):
+    if pil_img.mode != "RGBA":
+        pil_img = pil_img.convert("RGBA")
+
+    w, h = pil_img.size
+    wx_img = wx.Image(w, h)
+    wx_img.SetData(pil_img.convert("RGB").tobytes())
+    wx_img.SetAlpha(pil_img.split()[-1].tobytes())
+    return wx.Bitmap(wx_img)
+
+
+def time_conversion(convert, img, runs):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        convert(img)
+        times.append((time.perf_counter() - t0) * 1000)
+
+    tracemalloc.start()
+    convert(img)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return times, peak
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="PIL → wx.Bitmap conversion cost.")
+    ap.add_argument("--runs", type=int, default=50, help="timed conversions (default: 50)")
+    ap.add_argument("--size", type=int, nargs=2, default=(1550, 800), metavar=("W", "H"),
+                    help="bitmap size (default: 1550 800)")
+    args = ap.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("No DISPLAY — run under a virtual frame buffer, e.g. `xvfb-run -a python "
+              "benchmarks/bitmap_bench.py`", file=sys.stderr)
+        return 2
+
+    app = wx.App(False)
+    img = Image.open(BACKGROUND).convert("RGBA").resize(tuple(args.size), Image.LANCZOS)
+
+    print(f"background.png at {img.size[0]}x{img.size[1]}, {args.runs} runs")
+    print(f"{'Path':<10} {'ms':>8} {'p95':>8} {'peak MB':>9}")
+    print("-" * 38)
+    for name, convert in (("wx.Image", legacy_pil_to_wx_bitmap), ("buffer", pil_to_wx_bitmap)):
+        convert(img)  # warm up
+        ms, peak = time_conversion(convert, img, args.runs)
+        p95 = sorted(ms)[int(0.95 * (len(ms) - 1))]
+        print(f"{name:<10} {statistics.median(ms):>8.2f} {p95:>8.2f} {peak / 2**20:>9.1f}")
+
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# ================================================================
+#   StudyAura — startup import-time report
+# ================================================================
+"""
+Shows what `import main` costs at startup and what each screen adds on
+its first navigation, using CPython's -X importtime in fresh
+interpreters (so nothing is already cached in sys.modules).
+
+    python benchmarks/import_report.py
+    python benchmarks/import_report.py --top 25
+
+Run it on two commits to compare startup import cost before and after a
+change. No display is needed: nothing is constructed, only imported.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def importtime(code):
+    """[(self_us, cumulative_us, module)] for one fresh interpreter running code."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cum_us), name.rstrip()))
+    return rows
+
+
+def total_ms(rows):
+    # top-level imports are the unindented names
+    return sum(cum for _, cum, name in rows if not name.startswith("  ")) / 1000
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Startup import-time report for StudyAura.")
+    ap.add_argument("--top", type=int, default=15, help="heaviest startup imports to list")
+    args = ap.parse_args(argv)
+
+    startup = importtime("import main")
+    names = {name.strip() for _, _, name in startup}
+    print(f"import main: {total_ms(startup):.1f} ms, {len(startup)} modules")
+
+    eager = sorted(n for n in names if n.startswith("modules."))
+    print("screen modules imported at startup:", ", ".join(eager) or "none")
+
+    print("\nHeaviest startup imports (cumulative):")
+    for _, cum_us, name in sorted(startup, key=lambda r: -r[1])[:args.top]:
+        print(f"  {cum_us / 1000:8.1f} ms  {name.strip()}")
+
+    from main import SCREENS
+    print("\nAdded by first navigation (on top of `import main`):")
+    for screen, (module, _) in SCREENS.items():
+        rows = importtime(f"import main; import {module}")
+        print(f"  {screen:<20} {total_ms(rows) - total_ms(startup):8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+# ================================================================
+#   StudyAura — per-island paint cost, vector vs sprite atlas
+# ================================================================
+"""
+Times JourneyMapScreen._draw_island against the vector drawing it
+replaced (kept below as legacy_draw_island), painting a row of islands
+of every skin into an offscreen MemoryDC each frame.
+
+    xvfb-run -a python benchmarks/island_bench.py
+    xvfb-run -a python benchmarks/island_bench.py --islands 12 --frames 300
+
+The atlas (every skin and wave phase) is rendered up front and reported
+separately as the one-off warm-up cost.
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+import wx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from modules.screen_journey_map import (  # noqa: E402
+    ISLAND, OVERLAY, SKIN_COLOURS, WAVE_PHASES, JourneyMapScreen, _island_sprites,
+    island_sprite,
+)
+
+FRAME_W, FRAME_H = 1550, 800
+WBOX, HBOX = 240, 120
+
+
+# ----------------------------------------------------------------
+# Reference: _draw_island before the sprite atlas
+# ----------------------------------------------------------------
+def legacy_draw_island(dc, x, y, t, wbox=WBOX, hbox=HBOX, float_offset=0, skin="tropical"):
+    dc.SetBrush(wx.Brush(wx.Colour(0,0,0,30)))
+    dc.SetPen(wx.Pen(wx.Colour(0,0,0,40)))
+    dc.DrawEllipse(int(x - wbox//2 - 8), int(y + hbox//2 + 6), int(wbox + 20), 32)
+
+    col1, _ = SKIN_COLOURS.get(skin, (ISLAND, ISLAND))
+    dc.SetBrush(wx.Brush(col1))
+    dc.SetPen(wx.Pen(wx.Colour(0,0,0,40)))
+    dc.DrawRoundedRectangle(int(x - wbox//2), int(y - hbox//2 + float_offset), int(wbox), int(hbox), 28)
+
+    dc.SetBrush(wx.Brush(OVERLAY))
+    dc.SetPen(wx.Pen(wx.Colour(0,0,0,0)))
+    dc.DrawRoundedRectangle(int(x - wbox//2 + 10), int(y - hbox//2 + 10 + float_offset), int(wbox - 20), int(hbox - 30), 18)
+
+    px = int(x + wbox//2 - 30)
+    py = int(y - hbox//2 + 10 + float_offset)
+    dc.SetPen(wx.Pen(wx.Colour(30, 180, 80)))
+    dc.SetBrush(wx.Brush(wx.Colour(30, 180, 80)))
+    dc.DrawCircle(px, py, 6)
+    dc.DrawCircle(px+8, py-6, 5)
+    dc.DrawCircle(px-8, py-6, 5)
+
+    g = wx.GraphicsContext.Create(dc)
+    if g:
+        wave_alpha = int(60 + 60 * (0.5 + 0.5 * math.sin(t*1.2 + x*0.01)))
+        info = wx.GraphicsPenInfo(wx.Colour(0, 120, 160, wave_alpha)).Width(2).Cap(wx.CAP_ROUND)
+        g.SetPen(g.CreatePen(info))
+        path = g.CreatePath()
+        path.AddCircle(x, y + hbox//2 - 6, int(wbox//2 + 6 + 6 * math.sin(t*1.8 + x*0.02)))
+        g.StrokePath(path)
+
+
+class _Host:
+    """Stand-in for the screen: _draw_island only reads time0."""
+
+    def __init__(self):
+        self.time0 = time.time()
+
+
+def _layout(n):
+    skins = list(SKIN_COLOURS)
+    step = FRAME_W // (n + 1)
+    return [(step * (i + 1), FRAME_H // 2, skins[i % len(skins)]) for i in range(n)]
+
+
+def time_frames(draw, islands, frames):
+    """Per-island milliseconds for each frame."""
+    bmp = wx.Bitmap(FRAME_W, FRAME_H)
+    dc = wx.MemoryDC(bmp)
+    out = []
+    t_start = time.time()
+    for _ in range(frames):
+        t = time.time() - t_start
+        dc.SetBackground(wx.Brush(wx.Colour(6, 18, 30)))
+        dc.Clear()
+        t0 = time.perf_counter()
+        for i, (x, y, skin) in enumerate(islands):
+            draw(dc, x, y, t, int(math.sin(t*0.9 + i*0.5) * 6), skin)
+        out.append((time.perf_counter() - t0) * 1000 / len(islands))
+    dc.SelectObject(wx.NullBitmap)
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Per-island paint cost, vector vs sprites.")
+    ap.add_argument("--islands", type=int, default=8, help="islands per frame (default: 8)")
+    ap.add_argument("--frames", type=int, default=200, help="timed frames (default: 200)")
+    args = ap.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("No DISPLAY — run under a virtual frame buffer, e.g. `xvfb-run -a python "
+              "benchmarks/island_bench.py`", file=sys.stderr)
+        return 2
+
+    app = wx.App(False)
+    islands = _layout(args.islands)
+    host = _Host()
+
+    def legacy(dc, x, y, t, fo, skin):
+        legacy_draw_island(dc, x, y + fo, t, float_offset=fo, skin=skin)
+
+    def sprites(dc, x, y, t, fo, skin):
+        JourneyMapScreen._draw_island(host, dc, x, y + fo, wbox=WBOX, hbox=HBOX,
+                                      float_offset=fo, skin=skin)
+
+    _island_sprites.clear()
+    t0 = time.perf_counter()
+    island_sprite("shadow", WBOX, HBOX)
+    for skin in SKIN_COLOURS:
+        island_sprite("body", WBOX, HBOX, skin)
+    for phase in range(WAVE_PHASES):
+        island_sprite("wave", WBOX, HBOX, phase)
+    warmup = (time.perf_counter() - t0) * 1000
+
+    print(f"{'Path':<10} {'ms/island':>10} {'p95':>8}")
+    print("-" * 30)
+    for name, draw in (("vector", legacy), ("sprites", sprites)):
+        ms = time_frames(draw, islands, args.frames)
+        p95 = sorted(ms)[int(0.95 * (len(ms) - 1))]
+        print(f"{name:<10} {statistics.median(ms):>10.3f} {p95:>8.3f}")
+    print(f"\natlas warm-up: {warmup:.1f} ms for {len(_island_sprites)} sprites")
+
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+# ================================================================
+#   StudyAura — headless paint benchmark for every screen
+# ================================================================
+"""
+Builds each screen against synthetic tasks.csv datasets and drives its
+paint handler into an offscreen wx.MemoryDC, reporting construction time,
+per-paint time and Python allocations.
+
+Runs on a headless Linux box under a virtual frame buffer:
+
+    xvfb-run -a python benchmarks/paint_bench.py
+    xvfb-run -a python benchmarks/paint_bench.py --sizes 100 10000 --screens Tasks Heatmap
+    xvfb-run -a python benchmarks/paint_bench.py --json bench_output.json
+
+The screens read data/ relative to their own module file, so the modules
+package is copied into a scratch directory next to a synthetic data/
+folder; the repository's own data is never touched. Allocation numbers
+come from tracemalloc and only cover Python-side objects, not memory
+owned by wx/C++.
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import wx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRAME_W, FRAME_H = 1550, 800
+DEFAULT_SIZES = (100, 10_000, 100_000)
+SUBJECTS = [
+    "Physics", "Chemistry", "Biology", "Maths", "History", "Geography",
+    "Literature", "Coding", "Economics", "Art", "Music", "Languages",
+]
+
+
+# ----------------------------------------------------------------
+# Synthetic data
+# ----------------------------------------------------------------
+def write_tasks_csv(path, n, seed=1234):
+    """n study sessions spread over the last ~5 years, deterministic per seed."""
+    rnd = random.Random(seed)
+    today = date.today()
+    # distinct titles grow with the dataset, as real subject lists do
+    titles = [f"{s} {i}" if i else s
+              for i in range(max(1, n // 1000)) for s in SUBJECTS]
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["title", "date", "start", "end", "color_index", "completed"])
+        for _ in range(n):
+            d = today - timedelta(days=rnd.randint(0, 5 * 365))
+            start = rnd.randint(6 * 60, 21 * 60)
+            end = min(23 * 60 + 59, start + rnd.choice((30, 60, 90, 120)))
+            w.writerow([
+                rnd.choice(titles),
+                d.strftime("%Y-%m-%d"),
+                f"{start // 60:02d}:{start % 60:02d}",
+                f"{end // 60:02d}:{end % 60:02d}",
+                rnd.randint(0, 4),
+                rnd.random() < 0.5,
+            ])
+
+
+def make_sandbox():
+    """Scratch tree: <tmp>/modules (copied) + <tmp>/data (synthetic)."""
+    tmp = tempfile.mkdtemp(prefix="studyaura-bench-")
+    shutil.copytree(os.path.join(ROOT, "modules"), os.path.join(tmp, "modules"),
+                    ignore=shutil.ignore_patterns("__pycache__", ".vscode"))
+    os.makedirs(os.path.join(tmp, "data"))
+    shutil.copy(os.path.join(ROOT, "data", "milestones.csv"), os.path.join(tmp, "data"))
+    shutil.copy(os.path.join(ROOT, "data", "schedule.json"), os.path.join(tmp, "data"))
+    return tmp
+
+
+# ----------------------------------------------------------------
+# Offscreen paint DC
+# ----------------------------------------------------------------
+class OffscreenPaintDCFactory:
+    """Stands in for wx.AutoBufferedPaintDC while benchmarking.
+
+    Returns a MemoryDC over a reused bitmap of the window's visible size
+    (capped at the frame size), so paint handlers can be called directly
+    outside of an EVT_PAINT.
+    """
+
+    def __init__(self):
+        self.bitmaps = {}
+
+    def __call__(self, window):
+        w, h = window.GetSize()
+        size = (max(1, min(w, FRAME_W)), max(1, min(h, FRAME_H)))
+        bmp = self.bitmaps.get(size)
+        if bmp is None:
+            bmp = self.bitmaps[size] = wx.Bitmap(*size)
+        return wx.MemoryDC(bmp)
+
+
+# ----------------------------------------------------------------
+# Screens under test
+# ----------------------------------------------------------------
+def _screens():
+    """(name, module, class, paint handler getter, setup) for each screen variant."""
+    return [
+        ("Tasks", "modules.tasks_screen", "TasksScreen",
+         lambda s: s.on_paint_grid, None),
+        ("Heatmap", "modules.screen_heatmap", "StudyHeatmapScreen",
+         lambda s: s.on_paint, None),
+        ("Heatmap/year", "modules.screen_heatmap", "StudyHeatmapScreen",
+         lambda s: s.on_paint, lambda s: s.toggle_view_mode()),
+        ("SubjectProgress", "modules.screen_subject_progress", "SubjectProgressScreen",
+         lambda s: s.on_paint_inner, None),
+        ("DailyProgress", "modules.screen_daily_progress", "DailyProgressScreen",
+         lambda s: s.on_paint, None),
+        ("JourneyMap", "modules.screen_journey_map", "JourneyMapScreen",
+         lambda s: s.on_paint, None),
+        ("JourneyMap/rain", "modules.screen_journey_map", "JourneyMapScreen",
+         lambda s: s.on_paint, lambda s: setattr(s, "weather", "rain")),
+        ("JourneyMap/stars", "modules.screen_journey_map", "JourneyMapScreen",
+         lambda s: s.on_paint, lambda s: setattr(s, "weather", "stars")),
+        ("Pomodoro", "modules.pomodoro", "PomodoroPage",
+         lambda s: s.on_paint, None),
+        # native widget trees: measured as a synchronous Refresh + Update
+        ("ToDoList", "modules.todo_list", "ToDoListScreen", None, None),
+        ("Notes", "modules.notes", "NotesPage", None, None),
+    ]
+
+
+def _stop_timers(window):
+    # animations would otherwise tick during wx.Yield and skew timings
+    t = getattr(window, "timer", None)
+    if isinstance(t, wx.Timer):
+        t.Stop()
+
+
+def _build(frame, cls):
+    screen = cls(parent=frame, nav_callback=lambda *_: None, back_callback=lambda: None)
+    screen.SetPosition((0, 0))
+    screen.SetSize((FRAME_W, FRAME_H))
+    wx.Yield()  # run CallAfter-deferred sizing
+    _stop_timers(screen)
+    return screen
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def bench_screen(frame, entry, paints):
+    name, mod_name, cls_name, target, setup = entry
+    cls = getattr(importlib.import_module(mod_name), cls_name)
+
+    # construction: timed run, then a traced run for allocations
+    t0 = time.perf_counter()
+    screen = _build(frame, cls)
+    construct_ms = (time.perf_counter() - t0) * 1000
+    screen.Destroy()
+
+    tracemalloc.start()
+    screen = _build(frame, cls)
+    _, construct_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if setup:
+        setup(screen)
+
+    if target:
+        handler = target(screen)
+        paint = lambda: handler(None)
+    else:
+        paint = lambda: (screen.Refresh(), screen.Update())
+
+    paint()  # warm caches the way the first real frame would
+
+    times = []
+    for _ in range(paints):
+        t0 = time.perf_counter()
+        paint()
+        times.append((time.perf_counter() - t0) * 1000)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    paint()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    screen.Destroy()
+    wx.Yield()
+
+    return {
+        "screen": name,
+        "construct_ms": construct_ms,
+        "construct_peak_kb": construct_peak / 1024,
+        "paint_ms_median": statistics.median(times),
+        "paint_ms_p95": _percentile(times, 95),
+        "paint_peak_kb": (peak - base) / 1024,
+        "paint_retained_kb": (after - base) / 1024,
+    }
+
+
+# ----------------------------------------------------------------
+# Report
+# ----------------------------------------------------------------
+COLUMNS = [
+    # key, title, width, value format
+    ("screen", "Screen", 18, "<"),
+    ("tasks", "Tasks", 7, ">"),
+    ("construct_ms", "Build ms", 9, ">.1f"),
+    ("construct_peak_kb", "Build KB", 9, ">.0f"),
+    ("paint_ms_median", "Paint ms", 9, ">.2f"),
+    ("paint_ms_p95", "p95 ms", 8, ">.2f"),
+    ("paint_peak_kb", "Paint KB", 9, ">.1f"),
+    ("paint_retained_kb", "Kept KB", 8, ">.1f"),
+]
+
+
+def format_header():
+    header = " ".join(f"{title:{fmt[0]}{width}}" for _, title, width, fmt in COLUMNS)
+    return header + "\n" + "-" * len(header)
+
+
+def format_row(row):
+    return " ".join(f"{row[key]:{fmt[0]}{width}{fmt[1:]}}" for key, _, width, fmt in COLUMNS)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless paint benchmark for StudyAura screens.")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                    help="synthetic task counts (default: 100 10000 100000)")
+    ap.add_argument("--screens", nargs="+", default=None,
+                    help="screen names to run (default: all)")
+    ap.add_argument("--paints", type=int, default=30, help="timed paints per screen")
+    ap.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    args = ap.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("No DISPLAY — run under a virtual frame buffer, e.g. `xvfb-run -a python "
+              "benchmarks/paint_bench.py`", file=sys.stderr)
+        return 2
+
+    sandbox = make_sandbox()
+    cwd = os.getcwd()
+    os.chdir(sandbox)          # NotesPage keeps its notes under ./data
+    sys.path.insert(0, sandbox)
+    sys.path.append(ROOT)      # top-level helpers (animations) the screens import
+
+    app = wx.App(False)
+    wx.AutoBufferedPaintDC = OffscreenPaintDCFactory()
+    frame = wx.Frame(None, size=(FRAME_W, FRAME_H))
+    frame.Show()
+
+    entries = [e for e in _screens() if not args.screens or e[0] in args.screens]
+    rows = []
+    print(format_header())
+    try:
+        for n in args.sizes:
+            write_tasks_csv(os.path.join(sandbox, "data", "tasks.csv"), n)
+            for entry in entries:
+                row = bench_screen(frame, entry, args.paints)
+                row["tasks"] = n
+                rows.append(row)
+                print(format_row(row), flush=True)
+    finally:
+        frame.Destroy()
+        os.chdir(cwd)
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,21 +3,29 @@
 # Smooth Hover Animation (A2 pre-rendered frames)
 # ---------------------------------------------------------
 
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import wx
 from PIL import Image
 
+from animations import AnimationTimer
+from startup_profile import profiler
+
 # --------------------------------------------------------------------
 # Helper: Convert PIL Image → wx.Bitmap
 # --------------------------------------------------------------------
 def pil_to_wx_bitmap(pil_img):
+    # one copy out of PIL (tobytes), which wx reads straight into the bitmap
     if pil_img.mode != "RGBA":
         pil_img = pil_img.convert("RGBA")
 
     w, h = pil_img.size
-    wx_img = wx.Image(w, h)
-    wx_img.SetData(pil_img.convert("RGB").tobytes())
-    wx_img.SetAlpha(pil_img.split()[-1].tobytes())
-    return wx.Bitmap(wx_img)
+    return wx.Bitmap.FromBufferRGBA(w, h, pil_img.tobytes())
 
 
 # --------------------------------------------------------------------
@@ -30,6 +38,226 @@ def load_pil_image(path, fallback_size=(150,150)):
         return Image.new("RGBA", fallback_size, (40,40,40,255))
 
 
+# --------------------------------------------------------------------
+# Scaled images on disk, so warm starts skip decoding and resampling
+# --------------------------------------------------------------------
+SCALED_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "scaled")
+SCALED_CACHE_MAX_BYTES = 96 * 1024 * 1024   # least recently used files go first
+SCALED_MAGIC = b"SAS1"
+SCALED_HEADER = struct.Struct("<4sII")      # magic, width, height
+
+# resampling filter per quality name (ToDoList used wx IMAGE_QUALITY_HIGH)
+RESAMPLE = {
+    "high": Image.LANCZOS,
+    "normal": Image.BILINEAR,
+}
+
+
+class ScaledImageStore:
+    """
+    Straight (non-premultiplied) RGBA of scaled images, one file per
+    (source path, mtime, pixel size, quality). A file is a 12-byte header
+    and the pixels, loaded with a single read.
+    """
+
+    def __init__(self, folder=SCALED_CACHE_DIR, max_bytes=SCALED_CACHE_MAX_BYTES):
+        self.folder = folder
+        self.max_bytes = max_bytes
+
+    def _file(self, path, px, quality):
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None      # missing source: its fallback is not worth caching
+        key = f"{os.path.abspath(path)}|{mtime}|{px[0]}x{px[1]}|{quality}"
+        return os.path.join(self.folder, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".rgba")
+
+    def load(self, path, px, quality="high"):
+        f = self._file(path, px, quality)
+        if f is None:
+            return None
+        try:
+            with open(f, "rb") as fh:
+                data = fh.read()
+            os.utime(f)      # recency for prune()
+        except OSError:
+            return None
+
+        w, h = px
+        if len(data) != SCALED_HEADER.size + w * h * 4:
+            return None
+        if SCALED_HEADER.unpack_from(data) != (SCALED_MAGIC, w, h):
+            return None
+        return Image.frombuffer("RGBA", px, memoryview(data)[SCALED_HEADER.size:],
+                                "raw", "RGBA", 0, 1)
+
+    def save(self, path, px, img, quality="high"):
+        f = self._file(path, px, quality)
+        if f is None:
+            return
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            tmp = f"{f}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(SCALED_HEADER.pack(SCALED_MAGIC, *px))
+                fh.write(img.tobytes())
+            os.replace(tmp, f)
+        except OSError as e:
+            print("Scaled image cache write error:", e)
+
+    def prune(self):
+        """Drop least recently used files until the folder fits max_bytes."""
+        try:
+            entries = [e for e in os.scandir(self.folder) if e.is_file()]
+        except OSError:
+            return
+        stats = sorted(((e.stat(), e.path) for e in entries), key=lambda x: x[0].st_mtime)
+        total = sum(st.st_size for st, _ in stats)
+        for st, f in stats:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(f)
+                total -= st.st_size
+            except OSError:
+                pass
+
+
+# --------------------------------------------------------------------
+# Shared bitmap cache: (asset, logical size, scale factor) → wx.Bitmap
+# --------------------------------------------------------------------
+BITMAP_CACHE_MAX = 96      # scaled bitmaps kept across all screens (home set is ~61)
+SOURCE_CACHE_MAX = 8       # decoded source images kept for re-scaling
+
+# one worker: scaling is CPU-bound and the UI only waits on its first frame
+_scale_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bitmap-scale")
+
+
+class BitmapCache:
+    """
+    LRU cache of resampled bitmaps (LANCZOS for the default "high" quality).
+
+    Bitmaps are rendered at logical size × content scale factor and tagged
+    with that factor, so they draw crisp at their logical size on HiDPI
+    screens. A DPI change only scales the entries it has not seen before.
+    Scaled pixels also go to a ScaledImageStore for the next run.
+
+    Decoding and resizing (scaled_image) may run on the worker thread;
+    wx.Bitmaps are only ever created on the UI thread.
+    """
+
+    def __init__(self, max_entries=BITMAP_CACHE_MAX, store=None):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.sources = OrderedDict()
+        self.store = store or ScaledImageStore()
+        self.lock = threading.Lock()     # guards the sources dict (UI + worker thread), not decoding
+
+    @staticmethod
+    def key(path, size, scale, quality="high"):
+        return (path, tuple(size), round(scale, 2), quality)
+
+    @staticmethod
+    def pixel_size(size, scale):
+        w, h = size
+        return (max(1, round(w * scale)), max(1, round(h * scale)))
+
+    def source(self, path, fallback_size=(150,150)):
+        with self.lock:
+            img = self.sources.get(path)
+            if img is not None:
+                self.sources.move_to_end(path)
+                return img
+
+        # decode unlocked: the UI thread must not wait on the worker's
+        # background.png decode to get an icon's base frame
+        img = load_pil_image(path, fallback_size)
+        with self.lock:
+            img = self.sources.setdefault(path, img)
+            while len(self.sources) > SOURCE_CACHE_MAX:
+                self.sources.popitem(last=False)
+        return img
+
+    def scaled_image(self, path, px, fallback_size=None, quality="high"):
+        """PIL RGBA image of `path` at pixel size px — from disk if scaled before."""
+        img = self.store.load(path, px, quality)
+        if img is not None:
+            return img
+        img = self.source(path, fallback_size or px)
+        if img.size != px:
+            img = img.resize(px, RESAMPLE[quality])
+        self.store.save(path, px, img, quality)
+        return img
+
+    def _insert(self, key, img, scale):
+        bmp = pil_to_wx_bitmap(img)
+        if scale != 1.0:
+            bmp.SetScaleFactor(scale)
+
+        self.entries[key] = bmp
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return bmp
+
+    def get(self, path, size, scale=1.0, fallback_size=None, quality="high"):
+        key = self.key(path, size, scale, quality)
+        bmp = self.entries.get(key)
+        if bmp is not None:
+            self.entries.move_to_end(key)
+            return bmp
+
+        img = self.scaled_image(path, self.pixel_size(size, scale),
+                                fallback_size or tuple(size), quality)
+        return self._insert(key, img, scale)
+
+    def prefetch(self, path, sizes, scale, on_ready, quality="high"):
+        """
+        Make bitmaps for `sizes` without blocking the UI: missing ones are
+        scaled on the worker thread, then on_ready(bitmaps, in sizes order)
+        runs on the UI thread via wx.CallAfter.
+        """
+        missing = [s for s in sizes
+                   if self.key(path, s, scale, quality) not in self.entries]
+
+        def finish(images):
+            with profiler.phase(f"bitmaps {os.path.basename(path)}"):
+                for size, img in images:
+                    key = self.key(path, size, scale, quality)
+                    if key not in self.entries:
+                        self._insert(key, img, scale)
+            on_ready([self.get(path, s, scale, quality=quality) for s in sizes])
+
+        def work():
+            with profiler.phase(f"scale {os.path.basename(path)}", "worker"):
+                images = [(s, self.scaled_image(path, self.pixel_size(s, scale), tuple(s), quality))
+                          for s in missing]
+            wx.CallAfter(finish, images)
+
+        if missing:
+            _scale_pool.submit(work)
+        else:
+            wx.CallAfter(finish, [])     # always async, so callers see one behaviour
+
+    def when_idle(self, callback):
+        """Run callback on the UI thread once the work queued so far is done."""
+        _scale_pool.submit(wx.CallAfter, callback)
+
+    def prune_disk(self):
+        """Trim the on-disk store in the background."""
+        _scale_pool.submit(self.store.prune)
+
+    def clear(self):
+        self.entries.clear()
+        with self.lock:
+            self.sources.clear()
+
+
+bitmap_cache = BitmapCache()
+
+
+HOVER_TICK_MS = 15         # one growth frame per tick at full rate
+
+
 # ---------------------------------------------------------
 # CLASS: AnimatedIcon
 # ---------------------------------------------------------
@@ -42,31 +270,30 @@ class AnimatedIcon(wx.Panel):
       - Click event callback
     """
 
-    def __init__(self, parent, name, pil_img,
+    def __init__(self, parent, name, image_path,
                  base_size=(150,150), frames=10,
                  pos=(0,0), action=None):
         
         super().__init__(parent)
         self.name = name
         self.action = action
+        self.image_path = image_path
 
         self.hover = False
         base_w, base_h = base_size
 
         # -----------------------------------------------------
-        # Pre-render frames: 100% → 115% (smooth scaling)
+        # Frame sizes: 100% → 115% (smooth scaling)
         # -----------------------------------------------------
-        self.frames = []
+        self.frame_sizes = []
         for i in range(frames):
             t = i / (frames - 1)
             scale = 1.0 + 0.15 * t
-            w = int(base_w * scale)
-            h = int(base_h * scale)
-            scaled_img = pil_img.resize((w, h), Image.LANCZOS)
-            self.frames.append(pil_to_wx_bitmap(scaled_img))
+            self.frame_sizes.append((int(base_w * scale), int(base_h * scale)))
 
         self.frame_index = 0
         self.max_frame = frames - 1
+        self.load_frames()
 
         # -----------------------------------------------------
         # Panel Size — large enough for full-scale + label
@@ -79,7 +306,7 @@ class AnimatedIcon(wx.Panel):
         # Icon Image
         # -----------------------------------------------------
         self.bmp = wx.StaticBitmap(self, bitmap=self.frames[0])
-        self.center_bitmap(self.frames[0])
+        self.center_bitmap()
 
         # -----------------------------------------------------
         # Label
@@ -102,7 +329,7 @@ class AnimatedIcon(wx.Panel):
         # -----------------------------------------------------
         # Timer for animation
         # -----------------------------------------------------
-        self.timer = wx.Timer(self)
+        self.timer = AnimationTimer(self)
         self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
 
         # -----------------------------------------------------
@@ -119,12 +346,12 @@ class AnimatedIcon(wx.Panel):
     def on_enter(self, evt):
         self.hover = True
         if not self.timer.IsRunning():
-            self.timer.Start(15)
+            self.timer.Start(HOVER_TICK_MS)
 
     def on_leave(self, evt):
         self.hover = False
         if not self.timer.IsRunning():
-            self.timer.Start(15)
+            self.timer.Start(HOVER_TICK_MS)
 
     def on_click(self, evt):
         if callable(self.action):
@@ -134,26 +361,60 @@ class AnimatedIcon(wx.Panel):
     # Timer: Move animation forward/backward
     # ---------------------------------------------------------
     def on_timer(self, evt):
+        # frames per tick: throttled (unfocused) ticks skip ahead, same duration
+        steps = max(1, round(self.timer.GetInterval() / HOVER_TICK_MS))
         if self.hover:
             if self.frame_index < self.max_frame:
-                self.frame_index += 1
+                self.frame_index = min(self.max_frame, self.frame_index + steps)
             else:
                 self.timer.Stop()
         else:
             if self.frame_index > 0:
-                self.frame_index -= 1
+                self.frame_index = max(0, self.frame_index - steps)
             else:
                 self.timer.Stop()
 
-        bmp = self.frames[self.frame_index]
-        self.bmp.SetBitmap(bmp)
-        self.center_bitmap(bmp)
+        self.bmp.SetBitmap(self.frames[self.frame_index])
+        self.center_bitmap()
+
+    # ---------------------------------------------------------
+    # Frames from the shared cache, at the current DPI
+    # ---------------------------------------------------------
+    def load_frames(self):
+        """
+        Base frame now, the growth frames from the worker thread. Until they
+        arrive every frame is the base one, so hovering early just doesn't grow.
+        """
+        scale = self.GetContentScaleFactor()
+        base = bitmap_cache.get(self.image_path, self.frame_sizes[0], scale)
+        self.frames = [base] * len(self.frame_sizes)
+        self.frames_ready = False
+        self.frames_request = request = object()
+
+        def ready(frames):
+            # icon destroyed, or a newer (DPI) request superseded this one
+            if not self or self.frames_request is not request:
+                return
+            self.frames = frames
+            self.frames_ready = True
+            self.bmp.SetBitmap(self.frames[self.frame_index])
+            self.center_bitmap()
+
+        bitmap_cache.prefetch(self.image_path, self.frame_sizes, scale, ready)
+
+    def rescale(self):
+        """Re-fetch frames after a DPI change."""
+        self.load_frames()
+        self.bmp.SetBitmap(self.frames[self.frame_index])
+        self.center_bitmap()
 
     # ---------------------------------------------------------
     # Helper: Re-center bitmap on growth/shrink
     # ---------------------------------------------------------
-    def center_bitmap(self, bmp):
+    def center_bitmap(self):
+        # logical width: HiDPI frames have more pixels than they occupy
+        w = self.frame_sizes[self.frame_index if self.frames_ready else 0][0]
         self.bmp.SetPosition((
-            (self.GetSize()[0] - bmp.GetWidth())//2,
+            (self.GetSize()[0] - w)//2,
             0
         ))
@@ -1,19 +1,15 @@
 # ================================================================
 #             StudyAura —MAIN screen(wxPython version) 
 # ================================================================
+from startup_profile import profiler    # first, so it times every import below
 import wx
 import os
-from PIL import Image
-from icon_button import AnimatedIcon, load_pil_image, pil_to_wx_bitmap
-from modules.tasks_screen import TasksScreen
-from modules.todo_list import ToDoListScreen
-from modules.screen_home import HomeScreen
-from modules.screen_subject_progress import SubjectProgressScreen
-from modules.screen_daily_progress import DailyProgressScreen
-from modules.screen_heatmap import StudyHeatmapScreen
-from modules.pomodoro import PomodoroPage
-from modules.notes import NotesPage
-from modules.screen_journey_map import JourneyMapScreen
+import importlib
+import time
+from collections import OrderedDict, deque
+from animations import AnimationTimer, PageTransition, animation_policy
+from icon_button import AnimatedIcon, bitmap_cache
+from perf_hud import PerfHUD
 
 # ICONS + DIMENSIONS
 BASE_PATH = os.path.dirname(__file__)
@@ -28,6 +24,68 @@ ASSETS = {
 }
 DESIGN_W, DESIGN_H = 1550, 800
 ICON_SIZE = (150, 150)
+TITLE_TICK_MS = 16        # TitleCanvas fade-in: max_frames ticks at full rate
+SPLASH_BG = wx.Colour(18, 20, 34)   # background.png's mean colour, until it is scaled
+SCREEN_CACHE_MAX = 3      # screens kept alive (suspended) for quick switching back
+SCREEN_TRANSITIONS = True # slide between screens (animations.PageTransition)
+
+# SCREENS: navigation name -> (module, class), imported on first use
+SCREENS = {
+    "Tasks": ("modules.tasks_screen", "TasksScreen"),
+    "To-do List": ("modules.todo_list", "ToDoListScreen"),
+    "Study Journey Map": ("modules.screen_journey_map", "JourneyMapScreen"),
+    "Notes": ("modules.notes", "NotesPage"),
+    "Pomodoro": ("modules.pomodoro", "PomodoroPage"),
+    "Subject Progress": ("modules.screen_subject_progress", "SubjectProgressScreen"),
+    "Study Heatmap": ("modules.screen_heatmap", "StudyHeatmapScreen"),
+    "Daily Progress": ("modules.screen_daily_progress", "DailyProgressScreen"),
+}
+SCREEN_ALIASES = {
+    "SubjectProgress": "Subject Progress",
+    "Heatmap": "Study Heatmap",
+    "DailyProgress": "Daily Progress",
+}
+
+
+class ScreenRegistry:
+    """
+    Screen names -> classes, importing each screen module on first
+    navigation. The wall time of that first import (including anything
+    the module pulls in, e.g. wx.adv or numpy) is kept per screen.
+    """
+
+    def __init__(self, screens, aliases=None):
+        self.screens = dict(screens)
+        self.aliases = dict(aliases or {})
+        self.classes = {}
+        self.import_ms = {}
+
+    def resolve(self, name):
+        name = self.aliases.get(name, name)
+        return name if name in self.screens else None
+
+    def get(self, name):
+        name = self.resolve(name)
+        if name is None:
+            return None
+        cls = self.classes.get(name)
+        if cls is None:
+            module, attr = self.screens[name]
+            t0 = time.perf_counter()
+            with profiler.phase(f"screen {name}", "screen"):
+                cls = getattr(importlib.import_module(module), attr)
+            self.import_ms[name] = (time.perf_counter() - t0) * 1000
+            self.classes[name] = cls
+        return cls
+
+    def report(self):
+        lines = ["Screen imports (first navigation):"]
+        for name, ms in sorted(self.import_ms.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {name:<20} {ms:8.1f} ms")
+        if len(lines) == 1:
+            lines.append("  (none yet)")
+        return "\n".join(lines)
+
 # TRANSPARENT TITLE CANVAS
 class TitleCanvas(wx.Window):
     def __init__(self, parent, pos=(0, 0), size=(900, 420)):
@@ -53,14 +111,17 @@ class TitleCanvas(wx.Window):
         self.sub_font = wx.Font(15, wx.FONTFAMILY_SWISS,
                                 wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
 
-        self.timer = wx.Timer(self)
+        self._text_layer = None      # see text_layer()
+
+        self.timer = AnimationTimer(self)
         self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
 
     def start(self, delay=50):
-        wx.CallLater(delay, lambda: self.timer.Start(16))
+        wx.CallLater(delay, lambda: self.timer.Start(TITLE_TICK_MS))
 
     def on_timer(self, evt):
-        self.frame += 1
+        # fractional frames: throttled (unfocused) ticks keep the same duration
+        self.frame += self.timer.GetInterval() / TITLE_TICK_MS
         t = min(1.0, self.frame / self.max_frames)
         ease = 1 - (1 - t) ** 3
 
@@ -71,31 +132,47 @@ class TitleCanvas(wx.Window):
         if t >= 1:
             self.timer.Stop()
 
-    def on_paint(self, evt):
-        pdc = wx.AutoBufferedPaintDC(self)
+    def text_layer(self):
+        """Title + subtitle at full opacity, rendered once per widget size."""
         w, h = self.GetSize()
+        if self._text_layer is not None and self._text_layer.GetSize() == (w, h):
+            return self._text_layer
 
-        bmp = wx.Bitmap(w, h, 32)
+        bmp = wx.Bitmap.FromRGBA(w, h, 0, 0, 0, 0)
         mem = wx.MemoryDC(bmp)
-        mem.SetBackground(wx.Brush(wx.Colour(0, 0, 0, 0)))
-        mem.Clear()
-
         gc = wx.GraphicsContext.Create(mem)
-        col = wx.Colour(255, 255, 255, int(self.alpha * 255))
-        gc.SetFont(self.title_font, col)
+        gc.SetFont(self.title_font, wx.WHITE)
 
         x = 40
-        y = 10 + self.offset_y
+        y = 10
         lh = self.title_font.GetPixelSize().y + 6
 
         for i, line in enumerate(self.title_lines):
             gc.DrawText(line, x, y + i * lh)
 
-        gc.SetFont(self.sub_font, col)
+        gc.SetFont(self.sub_font, wx.WHITE)
         gc.DrawText(self.subtitle, x, y + len(self.title_lines) * lh + 25)
 
+        del gc
         mem.SelectObject(wx.NullBitmap)
-        pdc.DrawBitmap(bmp, 0, 0, True)
+        self._text_layer = bmp
+        return bmp
+
+    def on_paint(self, evt):
+        pdc = wx.AutoBufferedPaintDC(self)
+        layer = self.text_layer()
+        if self.alpha <= 0:
+            return
+        if self.alpha >= 1:
+            pdc.DrawBitmap(layer, 0, self.offset_y, True)
+            return
+
+        # fade-in: the cached layer composited at the current opacity
+        gc = wx.GraphicsContext.Create(pdc)
+        gc.BeginLayer(self.alpha)
+        gc.DrawBitmap(layer, 0, self.offset_y, *layer.GetSize())
+        gc.EndLayer()
+        del gc      # flush before pdc copies its buffer to the window
 
 # MAIN FRAME
 class MainFrame(wx.Frame):
@@ -106,59 +183,138 @@ class MainFrame(wx.Frame):
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
         self.Bind(wx.EVT_PAINT, self.on_paint_frame)
 
-        # Load background
-        bg_path = os.path.join(ICON_FOLDER, ASSETS["background"])
-        pil_bg = load_pil_image(bg_path, fallback_size=(DESIGN_W, DESIGN_H))
-        pil_bg = pil_bg.resize((DESIGN_W, DESIGN_H), Image.LANCZOS)
-        self._bg_bitmap = pil_to_wx_bitmap(pil_bg)
+        # Pause / throttle decorative animation while minimised or unfocused
+        animation_policy.attach(self)
 
-        # Title
-        self.title = TitleCanvas(self, pos=(0, 200), size=(690, 300))
-        self.title.start()
+        # Home widgets arrive progressively (see build_home_steps)
+        self._bg_bitmap = None
+        self.first_painted = False
+        self.title = None
+        self.icons = []
+
+        # Bitmaps follow the monitor's scale factor
+        self.Bind(wx.EVT_DPI_CHANGED, self.on_dpi_changed)
+
+        self.current_screen = None
+        self.screens = ScreenRegistry(SCREENS, SCREEN_ALIASES)
+        if profiler.enabled:
+            # first-navigation import costs, rewritten into the report on close
+            profiler.sections.append(self.screens.report)
+            self.Bind(wx.EVT_CLOSE, self.on_close_profiled)
+        self.screen_cache = OrderedDict()    # screen class -> live instance, LRU
+
+        # Snapshot slide between screens (see show_screen)
+        self.transition = PageTransition(self, (DESIGN_W, DESIGN_H))
+
+        # Frame-time HUD (F3)
+        self.hud = PerfHUD(self)
+        hud_id = wx.NewIdRef()
+        self.Bind(wx.EVT_MENU, lambda e: self.hud.toggle(), id=hud_id)
+        self.SetAcceleratorTable(wx.AcceleratorTable([
+            (wx.ACCEL_NORMAL, wx.WXK_F3, hud_id),
+        ]))
+
+        # First pixels now (solid colour), assets over the next loop turns
+        self.Show()
+        self.startup_steps = deque(self.build_home_steps())
+        wx.CallAfter(self.run_startup_step)
 
-        # Home icons
+    # PROGRESSIVE STARTUP
+    def build_home_steps(self):
+        """One callable per event-loop turn: background, title, then each icon."""
+        steps = [self.load_background, self.build_title]
         names = ["Tasks", "To-do List", "Study Journey Map", "Notes", "Pomodoro"]
         xpos = [80, 380, 700, 1000, 1300]
-        ypos = 550
-
-        self.icons = []
-        for i, name in enumerate(names):
-            icon_path = os.path.join(ICON_FOLDER, ASSETS[name])
-            pil_icon = load_pil_image(icon_path, fallback_size=ICON_SIZE)
+        for name, x in zip(names, xpos):
+            steps.append(lambda name=name, x=x: self.build_icon(name, (x, 550)))
+        return steps
+
+    def run_startup_step(self):
+        step = self.startup_steps.popleft()
+        step()
+        if self.startup_steps:
+            wx.CallAfter(self.run_startup_step)
+            return
 
+        if not self.current_screen:
+            self.hud.track(self.home_widgets())
+        # Trim the on-disk scaled-image cache (queued behind the icon frames)
+        bitmap_cache.prune_disk()
+        if profiler.enabled:
+            # report once the scaling queued at startup is done
+            bitmap_cache.when_idle(profiler.write_report)
+
+    def build_title(self):
+        with profiler.phase("TitleCanvas"):
+            self.title = TitleCanvas(self, pos=(0, 200), size=(690, 300))
+            if self.current_screen:
+                self.title.Hide()
+            self.title.start()
+
+    def build_icon(self, name, pos):
+        with profiler.phase(f"AnimatedIcon {name}"):
             widget = AnimatedIcon(
                 parent=self,
                 name=name,
-                pil_img=pil_icon,
+                image_path=os.path.join(ICON_FOLDER, ASSETS[name]),
                 base_size=ICON_SIZE,
                 frames=12,
-                pos=(xpos[i], ypos),
+                pos=pos,
                 action=self.on_icon_click
             )
+        if self.current_screen:
+            widget.Hide()
+        else:
             widget.Raise()
-            self.icons.append(widget)
+        self.icons.append(widget)
 
-        self.current_screen = None
-        self.Show()
+    def home_widgets(self):
+        return [w for w in [self.title] + self.icons if w]
+
+    def load_background(self):
+        """Full-resolution background, scaled off the UI thread for this DPI."""
+        bg_path = os.path.join(ICON_FOLDER, ASSETS["background"])
+
+        def ready(bitmaps):
+            if not self:
+                return
+            self._bg_bitmap = bitmaps[0]
+            self.Refresh()
+
+        with profiler.phase("background"):
+            bitmap_cache.prefetch(bg_path, [(DESIGN_W, DESIGN_H)],
+                                  self.GetContentScaleFactor(), ready)
+
+    def on_close_profiled(self, evt):
+        profiler.write_report()
+        evt.Skip()
+
+    def on_dpi_changed(self, evt):
+        # moved to a monitor with another scale factor: swap in matching bitmaps
+        self.load_background()
+        for icon in self.icons:
+            icon.rescale()
+        self.Refresh()
+        evt.Skip()
 
-    
     def on_paint_frame(self, evt):
+        t0 = time.perf_counter()
         dc = wx.AutoBufferedPaintDC(self)
-        dc.DrawBitmap(self._bg_bitmap, 0, 0, True)
+        if self._bg_bitmap:
+            dc.DrawBitmap(self._bg_bitmap, 0, 0, True)
+        else:
+            dc.SetBackground(wx.Brush(SPLASH_BG))
+            dc.Clear()
+
+        if not self.first_painted:
+            self.first_painted = True
+            profiler.add("first paint", "phase", t0, time.perf_counter())
     
     # ICON CLICK HANDLER
     def on_icon_click(self, name):
-
-        if name == "Tasks":
-            self.show_screen(TasksScreen)
-        elif name == "To-do List":
-            self.show_screen(ToDoListScreen)
-        elif name == "Study Journey Map":
-            self.show_screen(JourneyMapScreen)
-        elif name == "Notes":
-            self.show_screen(NotesPage)
-        elif name == "Pomodoro":
-            self.show_screen(PomodoroPage)
+        screen_class = self.screens.get(name)
+        if screen_class:
+            self.show_screen(screen_class)
         else:
             wx.MessageBox(f"You clicked: {name}", "StudyAura")
     
@@ -168,62 +324,99 @@ class MainFrame(wx.Frame):
         if label == "Home":
             self.switch_to_home()
             return
-        if label == "Tasks":
-            self.show_screen(TasksScreen)
-            return
-        if label in ["Subject Progress", "SubjectProgress"]:
-            self.show_screen(SubjectProgressScreen)
-            return
-        if label in ["Study Heatmap", "Heatmap"]:
-            self.show_screen(StudyHeatmapScreen)
-            return
-        if label in ["Daily Progress", "DailyProgress"]:
-            self.show_screen(DailyProgressScreen)
-            return
+        screen_class = self.screens.get(label)
+        if screen_class:
+            self.show_screen(screen_class)
     # SCREEN MANAGEMENT
-    def _destroy_current_screen(self):
-        if self.current_screen:
-            try:
-                self.current_screen.Destroy()
-            except:
-                pass
-            self.current_screen = None
+    def _suspend_current_screen(self):
+        """Hide the current screen but keep it alive in screen_cache."""
+        screen = self.current_screen
+        if not screen:
+            return
+        self.hud.track([])
+        screen.Hide()
+        suspend = getattr(screen, "suspend", None)
+        if suspend:
+            suspend()
+        self.current_screen = None
 
     def show_screen(self, screen_class):
+        if SCREEN_TRANSITIONS:
+            self.transition.start(lambda: self._swap_to_screen(screen_class), direction=1)
+        else:
+            self._swap_to_screen(screen_class)
+
+    @staticmethod
+    def _keeps_alive(screen):
+        keep_alive = getattr(screen, "keep_alive", None)
+        return bool(keep_alive and keep_alive())
+
+    def _swap_to_screen(self, screen_class):
 
         # Hide home screen
-        self.title.Hide()
-        for icon in self.icons:
-            icon.Hide()
+        for widget in self.home_widgets():
+            widget.Hide()
 
-        self._destroy_current_screen()
+        self._suspend_current_screen()
 
-        # Try to init screen with callbacks
-        try:
-            self.current_screen = screen_class(
-                parent=self,
-                nav_callback=self.on_sidebar_nav,
-                back_callback=self.switch_to_home
-            )
-        except TypeError:
-            # Screen doesn't support callbacks
-            self.current_screen = screen_class(self)
+        screen = self.screen_cache.pop(screen_class, None)
+        if screen:
+            # Recently used: picks up where it was, reloading only changed data
+            resume = getattr(screen, "resume", None)
+            if resume:
+                resume()
+        else:
+            # Try to init screen with callbacks
+            try:
+                screen = screen_class(
+                    parent=self,
+                    nav_callback=self.on_sidebar_nav,
+                    back_callback=self.switch_to_home
+                )
+            except TypeError:
+                # Screen doesn't support callbacks
+                screen = screen_class(self)
+
+            screen.SetPosition((0, 0))
+            screen.SetSize((DESIGN_W, DESIGN_H))
+
+        # Most recently used last; destroy the oldest beyond the bound,
+        # skipping screens with work in progress (keep_alive(), e.g. a countdown)
+        self.screen_cache[screen_class] = screen
+        while len(self.screen_cache) > SCREEN_CACHE_MAX:
+            victim = next((cls for cls, s in self.screen_cache.items()
+                           if s is not screen and not self._keeps_alive(s)), None)
+            if victim is None:
+                break
+            old = self.screen_cache.pop(victim)
+            try:
+                old.Destroy()
+            except:
+                pass
 
-        self.current_screen.SetPosition((0, 0))
-        self.current_screen.SetSize((DESIGN_W, DESIGN_H))
-        self.current_screen.Show()
+        self.current_screen = screen
+        screen.Show()
+        self.hud.track([screen])
         self.Refresh()
 
     def switch_to_home(self):
-        self._destroy_current_screen()
+        if SCREEN_TRANSITIONS and self.current_screen:
+            self.transition.start(self._swap_to_home, direction=-1)
+        else:
+            self._swap_to_home()
 
-        self.title.Show()
-        for icon in self.icons:
-            icon.Show()
+    def _swap_to_home(self):
+        self._suspend_current_screen()
+
+        for widget in self.home_widgets():
+            widget.Show()
 
+        self.hud.track(self.home_widgets())
         self.Refresh()
 # ENTRY POINT
 if __name__ == "__main__":
-    app = wx.App(False)
-    frame = MainFrame()
+    with profiler.phase("wx.App"):
+        app = wx.App(False)
+    with profiler.phase("MainFrame"):
+        frame = MainFrame()
     app.MainLoop()
@@ -1,8 +1,26 @@
-# Makes all screens importable directly from modules
-from .tasks_screen import TasksScreen
-from .screen_home import HomeScreen
-from .screen_subject_progress import SubjectProgressScreen
-from .screen_daily_progress import DailyProgressScreen
-from .screen_heatmap import StudyHeatmapScreen
-from .screen_journey_map import JourneyMapScreen
-from .screen_streak import StudyStreakScreen
+# Makes all screens importable directly from modules.
+# Resolved lazily (PEP 562): importing one screen module, or the package,
+# does not drag in every other screen and its dependencies.
+import importlib
+
+_SCREENS = {
+    "TasksScreen": ".tasks_screen",
+    "HomeScreen": ".screen_home",
+    "SubjectProgressScreen": ".screen_subject_progress",
+    "DailyProgressScreen": ".screen_daily_progress",
+    "StudyHeatmapScreen": ".screen_heatmap",
+    "JourneyMapScreen": ".screen_journey_map",
+    "StudyStreakScreen": ".screen_streak",
+}
+
+__all__ = list(_SCREENS)
+
+
+def __getattr__(name):
+    try:
+        module = _SCREENS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,8 @@
 import wx
 import math
+import time
+
+from animations import HIDDEN, animation_policy
 
 class NeonButton(wx.Panel):
     def __init__(self, parent, label, bg_color, command):
@@ -41,7 +44,11 @@ class PomodoroPage(wx.Panel):
         self.time_left = 25 * 60
         self.total_time = 25 * 60
         self.is_break = False
+        self.deadline = None
 
+        # functional timer: a plain wx.Timer, never throttled by animation_policy.
+        # time_left is read off a monotonic deadline so late or coalesced ticks
+        # (minimised window, busy UI) cannot make the countdown drift.
         self.timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self.on_tick, self.timer)
 
@@ -127,9 +134,14 @@ class PomodoroPage(wx.Panel):
             tw, th = gc.GetTextExtent(time_str)
             gc.DrawText(time_str, cx - tw / 2, cy - th / 2)
 
+    def keep_alive(self):
+        """MainFrame must not evict this screen while a countdown runs."""
+        return self.running
+
     def start_timer(self):
         if not self.running:
             self.running = True
+            self.deadline = time.monotonic() + self.time_left
             self.timer.Start(1000)
 
     def reset_timer(self):
@@ -143,10 +155,13 @@ class PomodoroPage(wx.Panel):
 
     def on_tick(self, event):
         if self.time_left > 0:
-            self.time_left -= 1
+            self.time_left = max(0, round(self.deadline - time.monotonic()))
         else:
             self.switch_mode()
-        self.canvas.Refresh()
+
+        # nothing to show while the app is minimised; the next visible tick catches up
+        if animation_policy.state != HIDDEN:
+            self.canvas.Refresh()
 
     def switch_mode(self):
         self.running = False
@@ -4,6 +4,8 @@ import os
 import math
 from datetime import datetime, date, timedelta
 
+from animations import AnimationTimer
+
 # -------------------- THEME --------------------
 BG = wx.Colour(18, 24, 34)
 BAR_BG = wx.Colour(40, 55, 70)
@@ -19,6 +21,13 @@ ANIM_TIMER_MS = 16        # ~60 FPS
 ANIM_INCREMENT = 0.01     # progress bar increment per tick
 PULSE_SPEED = 0.12        # pulse phase increment per tick
 PULSE_AMPLITUDE = 0.12    # how much the pulse changes glow/size
+PULSE_STEPS = 8           # pre-rendered glow variants across one pulse
+GLOW_WIDTH_STEP = 256     # glow sprites are rendered at multiples of this width
+
+# Progress bar halo: (pad, alpha) per layer, outermost first
+BAR_GLOW_LAYERS = tuple((pad, int(80 / (i + 1))) for i, pad in enumerate((18, 12, 6)))
+# Overdue session halo: (pad, alpha factor) per layer, outermost first
+OVERDUE_GLOW_LAYERS = ((12, 0.14), (8, 0.24), (4, 0.36))
 
 
 # -------------------- UTIL --------------------
@@ -41,6 +50,99 @@ def parse_time_str(s: str):
         return None
 
 
+# -------------------- GLOW SPRITES --------------------
+# Rendered halos, shared by every DailyProgressScreen instance.
+# key: (kind, full_w, height, step) -> (wx.Bitmap, margin)
+_glow_sprites = {}
+_GLOW_CACHE_MAX = 64
+
+
+def _render_glow_pill(width, height, layers):
+    """Rasterise stacked translucent pill halos into one alpha bitmap.
+
+    layers is a sequence of (pad, wx.Colour), outermost first. Returns the
+    bitmap and the margin between its edge and the pill it surrounds.
+    """
+    margin = max(pad for pad, _ in layers) // 2 + 1
+    bw = width + 2 * margin
+    bh = height + 2 * margin
+    bmp = wx.Bitmap.FromRGBA(bw, bh, 0, 0, 0, 0)
+    mem = wx.MemoryDC(bmp)
+    gc = wx.GraphicsContext.Create(mem)
+    if gc:
+        gc.SetPen(wx.TRANSPARENT_PEN)
+        for pad, colour in layers:
+            gc.SetBrush(gc.CreateBrush(wx.Brush(colour)))
+            path = gc.CreatePath()
+            path.AddRoundedRectangle(margin - pad // 2, margin - pad // 2,
+                                     width + pad, height + pad, (height + pad) / 2)
+            gc.FillPath(path)
+        del gc
+    mem.SelectObject(wx.NullBitmap)
+    return bmp, margin
+
+
+def _glow_sprite(kind, width, height, step, layers_fn):
+    """Cached halo sprite wide enough for a pill of `width` px."""
+    full_w = -(-max(1, width) // GLOW_WIDTH_STEP) * GLOW_WIDTH_STEP
+    key = (kind, full_w, height, step)
+    entry = _glow_sprites.get(key)
+    if entry is None:
+        if len(_glow_sprites) >= _GLOW_CACHE_MAX:
+            _glow_sprites.clear()
+        bmp, margin = _render_glow_pill(full_w, height, layers_fn(step))
+        entry = _glow_sprites[key] = (bmp, margin, full_w)
+    return entry
+
+
+def _glow_pill_pieces(margin, full_w, w, h):
+    """Clipped pieces that fit a halo sprite to a pill of width w.
+
+    Every halo layer's round cap starts h/2 before the pill's right end, so
+    the sprite is drawn twice: as is for the left cap plus straight run, and
+    shifted left to where this pill ends for the right cap. Pills narrower
+    than their cap split at their midpoint instead, so neither cap is lost.
+
+    Returns [(clip_x, clip_w, shift)] relative to the sprite's origin.
+    """
+    split = margin + w - h // 2
+    if split <= 0:
+        split = margin + w // 2
+    return [
+        (0, split, 0),
+        (split, w + 2 * margin - split, w - full_w),
+    ]
+
+
+def _blit_glow_pill(dc, sprite, x, y, w, h):
+    """Blit a cached halo around the pill (x, y, w, h)."""
+    bmp, margin, full_w = sprite
+    bh = bmp.GetHeight()
+    ox, oy = x - margin, y - margin
+
+    for clip_x, clip_w, shift in _glow_pill_pieces(margin, full_w, w, h):
+        if clip_w <= 0:
+            continue
+        dc.SetClippingRegion(ox + clip_x, oy, clip_w, bh)
+        dc.DrawBitmap(bmp, ox + shift, oy, True)
+        dc.DestroyClippingRegion()
+
+
+def _bar_glow_layers(step):
+    return [(pad, wx.Colour(NEON.Red(), NEON.Green(), NEON.Blue(), alpha))
+            for pad, alpha in BAR_GLOW_LAYERS]
+
+
+def _overdue_glow_layers(step):
+    pulse = step / (PULSE_STEPS - 1)
+    layers = []
+    for pad, alpha_factor in OVERDUE_GLOW_LAYERS:
+        a = int(255 * alpha_factor * (0.7 + 0.3 * pulse))
+        pad_scale = int(pad * (1.0 + PULSE_AMPLITUDE * pulse))
+        layers.append((pad_scale, wx.Colour(OVERDUE_RED.Red(), OVERDUE_RED.Green(), OVERDUE_RED.Blue(), a)))
+    return layers
+
+
 # ============================================================
 #                      DailyProgressScreen
 # ============================================================
@@ -90,8 +192,20 @@ class DailyProgressScreen(wx.Panel):
         self.prev_rect = wx.Rect()
         self.next_rect = wx.Rect()
 
+        # sessions of view_day, rebuilt by _recompute_target_frac
+        self.day_sessions = []
+
+        # fonts (created once, reused on every paint)
+        self.title_font = wx.Font(34, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.date_font = wx.Font(18, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.arrow_font = wx.Font(28, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.pct_font = wx.Font(16, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.hour_font = wx.Font(11, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
+        self.empty_font = wx.Font(13, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
+        self.session_font = wx.Font(11, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+
         # timer for both progress fill and pulse
-        self.timer = wx.Timer(self)
+        self.timer = AnimationTimer(self)
         self.Bind(wx.EVT_TIMER, self._on_timer, self.timer)
         self.timer.Start(ANIM_TIMER_MS)
 
@@ -108,8 +222,15 @@ class DailyProgressScreen(wx.Panel):
         base = os.path.dirname(os.path.dirname(__file__))
         return os.path.join(base, "data", "tasks.csv")
 
+    def _tasks_csv_mtime(self):
+        try:
+            return os.path.getmtime(self._tasks_csv_path())
+        except OSError:
+            return None
+
     def _load_tasks_csv(self):
         path = self._tasks_csv_path()
+        self.loaded_mtime = self._tasks_csv_mtime()
         tasks = []
         if not os.path.exists(path):
             return tasks
@@ -171,25 +292,40 @@ class DailyProgressScreen(wx.Panel):
     def _recompute_target_frac(self):
         # recompute today totals and set target_frac
         sessions = self._sessions_for_day(self.view_day)
+        self.day_sessions = sessions
         total = sum(max(0, s["end_m"] - s["start_m"]) for s in sessions)
         done = sum(max(0, s["end_m"] - s["start_m"]) for s in sessions if s["completed"])
         self.target_frac = 0.0 if total == 0 else min(1.0, done / total)
 
     # ----------------- timer -----------------
     def _on_timer(self, evt):
+        # ticks are slower while the app is unfocused; keep animation speed constant
+        ticks = self.timer.GetInterval() / ANIM_TIMER_MS
+
         # progress bar easing toward target_frac
         if self.animated_frac < self.target_frac:
-            self.animated_frac = min(self.target_frac, self.animated_frac + ANIM_INCREMENT)
+            self.animated_frac = min(self.target_frac, self.animated_frac + ANIM_INCREMENT * ticks)
         elif self.animated_frac > self.target_frac:
             # rare case when target decreased
-            self.animated_frac = max(self.target_frac, self.animated_frac - ANIM_INCREMENT)
+            self.animated_frac = max(self.target_frac, self.animated_frac - ANIM_INCREMENT * ticks)
 
         # advance pulse (wrap)
-        self.pulse_phase = (self.pulse_phase + PULSE_SPEED) % (2 * math.pi)
+        self.pulse_phase = (self.pulse_phase + PULSE_SPEED * ticks) % (2 * math.pi)
 
         # refresh
         self.Refresh()
 
+    # ----------------- suspend / resume -----------------
+    # MainFrame keeps recent screens alive; nothing animates while hidden
+    def suspend(self):
+        self.timer.Stop()
+
+    def resume(self):
+        if self._tasks_csv_mtime() != self.loaded_mtime:
+            self.tasks = self._load_tasks_csv()
+            self._recompute_target_frac()
+        self.timer.Start(ANIM_TIMER_MS)
+
     # ----------------- clicks -----------------
     def on_left_down(self, evt):
         pt = evt.GetPosition()
@@ -258,16 +394,12 @@ class DailyProgressScreen(wx.Panel):
         w, h = self.GetSize()
 
         # Title
-        title_font = wx.Font(34, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
-        dc.SetFont(title_font)
+        dc.SetFont(self.title_font)
         dc.SetTextForeground(TEXT)
         dc.DrawText("⏳ Daily Study Time Progress", 40, 26)
 
         # Date & arrows
-        date_font = wx.Font(18, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
-        arrow_font = wx.Font(28, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
-
-        dc.SetFont(arrow_font)
+        dc.SetFont(self.arrow_font)
         prev_x = 40
         next_x = w - 60
         dc.SetTextForeground(TEXT)
@@ -276,7 +408,7 @@ class DailyProgressScreen(wx.Panel):
         self.prev_rect = wx.Rect(prev_x, 100, 36, 36)
         self.next_rect = wx.Rect(next_x, 100, 36, 36)
 
-        dc.SetFont(date_font)
+        dc.SetFont(self.date_font)
         date_str = self.view_day.strftime("%A, %d %B %Y")
         dc.DrawText(date_str, prev_x + 56, 106)
 
@@ -293,18 +425,9 @@ class DailyProgressScreen(wx.Panel):
         # Animated fill (neon)
         fill_w = int(bar_w * self.animated_frac)
         if fill_w > 0:
-            # glow layers behind fill
-            for i, pad in enumerate((18, 12, 6), start=0):
-                alpha = int(80 / (i + 1))
-                g = wx.Colour(NEON.Red(), NEON.Green(), NEON.Blue(), alpha)
-                gc = wx.GraphicsContext.Create(dc)
-                pen = gc.CreatePen(wx.GraphicsPenInfo(g).Width(12).Cap(wx.CAP_ROUND))
-                gc.SetPen(pen)
-                brush = gc.CreateBrush(wx.Brush(g))
-                gc.SetBrush(brush)
-                path = gc.CreatePath()
-                path.AddRoundedRectangle(bar_x - pad//2, bar_y - pad//2, fill_w + pad, bar_h + pad, (bar_h+pad)/2)
-                gc.FillPath(path)
+            # glow layers behind fill (pre-rendered halo)
+            _blit_glow_pill(dc, _glow_sprite("bar", bar_w, bar_h, 0, _bar_glow_layers),
+                            bar_x, bar_y, fill_w, bar_h)
 
             dc.SetBrush(wx.Brush(NEON))
             dc.SetPen(wx.Pen(NEON))
@@ -312,8 +435,7 @@ class DailyProgressScreen(wx.Panel):
 
         # percentage text
         pct_text = f"{int(self.animated_frac * 100)}% completed"
-        txt_font = wx.Font(16, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
-        dc.SetFont(txt_font)
+        dc.SetFont(self.pct_font)
         dc.SetTextForeground(TEXT)
         dc.DrawText(pct_text, bar_x, bar_y + bar_h + 12)
 
@@ -325,8 +447,7 @@ class DailyProgressScreen(wx.Panel):
         dc.DrawRoundedRectangle(bar_x, tl_y, bar_w, tl_h, 10)
 
         # draw hour ticks
-        hour_font = wx.Font(11, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
-        dc.SetFont(hour_font)
+        dc.SetFont(self.hour_font)
         dc.SetTextForeground(wx.Colour(170, 190, 205))
         start_hour = 6
         end_hour = 22
@@ -343,11 +464,11 @@ class DailyProgressScreen(wx.Panel):
                 dc.DrawText(s, x - tw//2, tl_y + tl_h + 10)
 
         # Draw sessions
-        sessions = self._sessions_for_day(self.view_day)
+        sessions = self.day_sessions
         self.session_rects = []
 
         if not sessions:
-            dc.SetFont(wx.Font(13, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL))
+            dc.SetFont(self.empty_font)
             dc.SetTextForeground(wx.Colour(170, 190, 205))
             dc.DrawText("No sessions scheduled for this day. Add tasks from Tasks screen.", bar_x + 8, tl_y + 24)
             return
@@ -358,6 +479,10 @@ class DailyProgressScreen(wx.Panel):
         session_y = tl_y + 12
         session_h = 40
 
+        # pulse factor from sine wave (0..1), quantised to a cached sprite step
+        pulse = (math.sin(self.pulse_phase) + 1.0) / 2.0
+        pulse_step = int(round(pulse * (PULSE_STEPS - 1)))
+
         for s in sessions:
             sm = s["start_m"]
             em = s["end_m"]
@@ -378,31 +503,14 @@ class DailyProgressScreen(wx.Panel):
             if is_completed:
                 main_color = NEON
             elif is_overdue:
-                # pulse factor from sine wave (0..1)
-                pulse = (math.sin(self.pulse_phase) + 1.0) / 2.0  # 0..1
-                pulse_factor = 1.0 + PULSE_AMPLITUDE * pulse
                 main_color = OVERDUE_RED
             else:
                 main_color = INCOMPLETE_GREY
 
-            # Draw glow for overdue (multi-layer translucent rounded rects scaled by pulse)
+            # Draw glow for overdue (pre-rendered halo at the current pulse step)
             if is_overdue:
-                pulse = (math.sin(self.pulse_phase) + 1.0) / 2.0  # 0..1
-                # draw 3 halo layers with increasing blur and decreasing alpha
-                for i, (pad, alpha_factor) in enumerate(((12, 0.14), (8, 0.24), (4, 0.36))):
-                    a = int(255 * alpha_factor * (0.7 + 0.3 * pulse))
-                    glow = wx.Colour(OVERDUE_RED.Red(), OVERDUE_RED.Green(), OVERDUE_RED.Blue(), a)
-                    gc = wx.GraphicsContext.Create(dc)
-                    pen = gc.CreatePen(wx.GraphicsPenInfo(glow).Width(12 + i*6).Cap(wx.CAP_ROUND))
-                    gc.SetPen(pen)
-                    brush = gc.CreateBrush(wx.Brush(glow))
-                    gc.SetBrush(brush)
-                    path = gc.CreatePath()
-                    # expand the rect slightly using pad and pulse_factor
-                    pad_scale = int(pad * (1.0 + PULSE_AMPLITUDE * pulse))
-                    path.AddRoundedRectangle(sx - pad_scale//2, session_y - pad_scale//2,
-                                             int(sw + pad_scale), int(session_h + pad_scale), (session_h + pad_scale)/2)
-                    gc.FillPath(path)
+                _blit_glow_pill(dc, _glow_sprite("overdue", sw, session_h, pulse_step, _overdue_glow_layers),
+                                sx, session_y, sw, session_h)
 
             # Draw main rounded rectangle
             dc.SetBrush(wx.Brush(main_color))
@@ -432,7 +540,7 @@ class DailyProgressScreen(wx.Panel):
                 dc.DrawLine(clk_cx, clk_cy, clk_cx + hand_len2, clk_cy)
 
             # title label centered in bar
-            dc.SetFont(wx.Font(11, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD))
+            dc.SetFont(self.session_font)
             dc.SetTextForeground(wx.Colour(230, 235, 240))
             title = s["title"]
             tw, th = dc.GetTextExtent(title)
@@ -2,7 +2,7 @@ import wx
 import os
 import csv
 import calendar
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 # ---------------- COLORS ----------------
 BG = wx.Colour(18, 24, 34)
@@ -13,12 +13,86 @@ TEXT = wx.Colour(200, 220, 255)
 
 DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
+# ---------------- YEAR VIEW ----------------
+YEAR_WEEKS = 54           # week columns in a year strip (Jan 1 may fall late in week 0)
+YEAR_MIN_YEARS = 5        # always show at least this many years
+YEAR_TOP = 140            # first strip starts below title + nav panel
+YEAR_HEADER_H = 40        # year title + month labels above the cells
+YEAR_STRIP_GAP = 24       # space between strips
+YEAR_LABEL_W = 40         # weekday labels left of the cells
+WHEEL_STEP = 60
+
+
+def heat_colour(count, max_count):
+    if max_count == 0 or count == 0:
+        return LOW
+    threshold = max(1, int(max_count * 0.4))
+    return MED if count <= threshold else HIGH
+
+
+def batch_by_colour(cells):
+    """[(colour, rect)] -> [(colour, [rect, ...])] in first-seen order, for DrawRectangleList."""
+    batches = {}
+    for colour, rect in cells:
+        batches.setdefault(colour.GetRGB(), (colour, []))[1].append(rect)
+    return list(batches.values())
+
+
+def draw_batches(dc, batches):
+    for colour, rects in batches:
+        dc.DrawRectangleList(rects, wx.Pen(colour), wx.Brush(colour))
+
+
+def year_grid_origin(year):
+    """Monday on or before Jan 1 — the date in week column 0, row 0."""
+    jan1 = date(year, 1, 1)
+    return jan1 - timedelta(days=jan1.weekday())
+
+
+# ---------------- PRE-AGGREGATED TILES ----------------
+class HeatmapTiles:
+    """Per-day, per-week, per-month and per-year task counts, built once per CSV load."""
+
+    def __init__(self, day_counts):
+        self.days = day_counts      # (y, m, d) -> count
+        self.weeks = {}             # Monday date -> count
+        self.months = {}            # (y, m) -> count
+        self.years = {}             # y -> count
+        self.year_max = {}          # y -> busiest day count
+
+        for (y, m, d), n in day_counts.items():
+            dt = date(y, m, d)
+            monday = dt - timedelta(days=dt.weekday())
+            self.weeks[monday] = self.weeks.get(monday, 0) + n
+            self.months[(y, m)] = self.months.get((y, m), 0) + n
+            self.years[y] = self.years.get(y, 0) + n
+            self.year_max[y] = max(self.year_max.get(y, 0), n)
+
+    def day(self, d):
+        return self.days.get((d.year, d.month, d.day), 0)
+
+    def week(self, d):
+        return self.weeks.get(d - timedelta(days=d.weekday()), 0)
+
+    def month(self, year, month):
+        return self.months.get((year, month), 0)
+
+    def year_range(self, today):
+        """Years to show, newest first (including years with planned tasks)."""
+        first = today.year - (YEAR_MIN_YEARS - 1)
+        last = today.year
+        if self.years:
+            first = min(first, min(self.years))
+            last = max(last, max(self.years))
+        return list(range(last, first - 1, -1))
+
 
 class StudyHeatmapScreen(wx.Panel):
     """
     Month-wise Heatmap (Mon–Sun horizontally, weeks vertically)
     Features:
     - Title + Month Navigation (layout-based, no overlap!)
+    - Year view: one 53-week strip per year, scrollable across all years
     - Real task-based heatmap from tasks.csv
     - Perfect responsive sizing (never exceeds screen)
     - Clean StudyAura styling
@@ -57,13 +131,34 @@ class StudyHeatmapScreen(wx.Panel):
         self.view_month = today.month
 
         self.day_counts = {}
-        self.grid_map = []
+        self.tiles = HeatmapTiles(self.day_counts)
+        self.data_version = 0
+        self.loaded_mtime = -1      # tasks.csv mtime at the last load (-1: never loaded)
+
+        # "month" or "year"
+        self.view_mode = "month"
+        self.year_scroll = 0
+        self.wheel_px = 0.0         # sub-pixel wheel remainder (touchpads, hi-res wheels)
+
+        # rendered year strips: (year, step, width) -> wx.Bitmap, for self._strips_version
+        self._year_strips = {}
+        self._strips_version = None
+
+        # month layout cache (see month_model)
+        self._model = None
+        self._model_key = None
+
+        self.day_font = wx.Font(13, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.cell_font = wx.Font(11, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
+        self.legend_font = wx.Font(12, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
+        self.strip_font = wx.Font(9, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
 
         # UI SETUP
         self._setup_ui()
         self._bind_events()
 
         self.load_all_task_counts()
+        self.update_month_label()
         self.Refresh()
 
 
@@ -86,6 +181,7 @@ class StudyHeatmapScreen(wx.Panel):
         self.btn_prev = wx.Button(nav_panel, label="<")
         self.lbl_month = wx.StaticText(nav_panel, label="")
         self.btn_next = wx.Button(nav_panel, label=">")
+        self.btn_mode = wx.Button(nav_panel, label="Year View")
 
         self.lbl_month.SetForegroundColour(TEXT)
         self.lbl_month.SetFont(wx.Font(
@@ -98,6 +194,7 @@ class StudyHeatmapScreen(wx.Panel):
         nav_sizer.Add(self.lbl_month, 0, wx.ALIGN_CENTER_VERTICAL)
         nav_sizer.AddStretchSpacer(1)
         nav_sizer.Add(self.btn_next, 0, wx.LEFT | wx.ALIGN_CENTER_VERTICAL, 25)
+        nav_sizer.Add(self.btn_mode, 0, wx.LEFT | wx.RIGHT | wx.ALIGN_CENTER_VERTICAL, 25)
 
         nav_panel.SetSizer(nav_sizer)
 
@@ -114,12 +211,14 @@ class StudyHeatmapScreen(wx.Panel):
     # EVENTS
     # -----------------------------------------------------
     def _bind_events(self):
-        self.btn_prev.Bind(wx.EVT_BUTTON, lambda e: self.change_month(-1))
-        self.btn_next.Bind(wx.EVT_BUTTON, lambda e: self.change_month(1))
+        self.btn_prev.Bind(wx.EVT_BUTTON, lambda e: self.change_page(-1))
+        self.btn_next.Bind(wx.EVT_BUTTON, lambda e: self.change_page(1))
+        self.btn_mode.Bind(wx.EVT_BUTTON, lambda e: self.toggle_view_mode())
 
         self.Bind(wx.EVT_SIZE, lambda e: (self.Refresh(), e.Skip()))
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_LEFT_DOWN, self.on_click)
+        self.Bind(wx.EVT_MOUSEWHEEL, self.on_mouse_wheel)
         self.Bind(wx.EVT_SHOW, self.on_show)
 
         # -----------------------------------------------------
@@ -137,8 +236,16 @@ class StudyHeatmapScreen(wx.Panel):
         base = os.path.dirname(os.path.dirname(__file__))
         return os.path.join(base, "data", "tasks.csv")
 
+    def tasks_csv_mtime(self):
+        try:
+            return os.path.getmtime(self.tasks_csv_path())
+        except OSError:
+            return None
+
     def load_all_task_counts(self):
         self.day_counts.clear()
+        self.data_version += 1
+        self.loaded_mtime = self.tasks_csv_mtime()
         path = self.tasks_csv_path()
 
         if not os.path.exists(path):
@@ -167,6 +274,8 @@ class StudyHeatmapScreen(wx.Panel):
         except Exception as e:
             print("Heatmap CSV Error:", e)
 
+        self.tiles = HeatmapTiles(self.day_counts)
+
 
     # -----------------------------------------------------
     # MONTH NAVIGATION
@@ -185,31 +294,80 @@ class StudyHeatmapScreen(wx.Panel):
         self.view_month = m
         self.view_year = y
 
-        self.load_all_task_counts()
+        self.update_month_label()
+        self.Refresh()
+
+    def change_page(self, delta):
+        if self.view_mode == "year":
+            # one strip per click; "<" goes back in time (down the list)
+            self.scroll_years(-delta * self.year_strip_height(self.GetSize()[0]))
+        else:
+            self.change_month(delta)
+
+    def toggle_view_mode(self):
+        self.view_mode = "year" if self.view_mode == "month" else "month"
+        self.year_scroll = 0
+        self.lbl_title.SetLabel(
+            "🔥 Study Heatmap — Year View" if self.view_mode == "year"
+            else "🔥 Study Heatmap — Month View"
+        )
+        self.btn_mode.SetLabel("Month View" if self.view_mode == "year" else "Year View")
+        self.update_month_label()
+        self.Layout()
+        self.Refresh()
+
+    def update_month_label(self):
+        if self.view_mode == "year":
+            years = self.tiles.year_range(date.today())
+            self.lbl_month.SetLabel(f"{years[-1]} – {years[0]}")
+        else:
+            month_name = calendar.month_name[self.view_month]
+            self.lbl_month.SetLabel(f"{month_name} {self.view_year}")
+        self.lbl_month.GetParent().Layout()
+
+    def on_mouse_wheel(self, evt):
+        if self.view_mode != "year":
+            evt.Skip()
+            return
+        self.wheel_px -= evt.GetWheelRotation() * WHEEL_STEP / (evt.GetWheelDelta() or 120)
+        px = int(self.wheel_px)
+        self.wheel_px -= px
+        if px:
+            self.scroll_years(px)
+
+    def scroll_years(self, delta):
+        w, h = self.GetSize()
+        total = len(self.tiles.year_range(date.today())) * self.year_strip_height(w)
+        max_scroll = max(0, total - (h - YEAR_TOP))
+        self.year_scroll = max(0, min(max_scroll, self.year_scroll + delta))
         self.Refresh()
 
     def on_show(self, evt):
-        if evt.IsShown():
+        # first show, and every resume from MainFrame's screen cache:
+        # re-read tasks.csv only if it changed since the last load
+        if evt.IsShown() and self.tasks_csv_mtime() != self.loaded_mtime:
             self.load_all_task_counts()
+            self.update_month_label()
             self.Refresh()
         evt.Skip()
 
+    def suspend(self):
+        # year strips are full-width bitmaps; re-rendered on demand
+        self._year_strips.clear()
+
 
     # -----------------------------------------------------
-    # PAINT — DRAW HEATMAP
+    # MONTH MODEL — layout, counts and colours
     # -----------------------------------------------------
-    def on_paint(self, evt):
-        dc = wx.AutoBufferedPaintDC(self)
-        dc.Clear()
-            # Ensure Back button updates on repaint
-        self.back_btn.Refresh()
-
-        w, h = self.GetSize()
-
-        # Month header text (set in UI)
-        month_name = calendar.month_name[self.view_month]
-        self.lbl_month.SetLabel(f"{month_name} {self.view_year}")
-
+    def month_model(self, w, h):
+        """Cell layout for the viewed month, rebuilt only when month, size or data change."""
+        key = (self.view_year, self.view_month, w, h, self.data_version)
+        if self._model_key != key:
+            self._model = self.build_month_model(w, h)
+            self._model_key = key
+        return self._model
+
+    def build_month_model(self, w, h):
         # Compute month layout
         first_wd, days_in_month = calendar.monthrange(self.view_year, self.view_month)
         dates = [date(self.view_year, self.view_month, d) for d in range(1, days_in_month + 1)]
@@ -236,55 +394,74 @@ class StudyHeatmapScreen(wx.Panel):
         x0 = int((w - total_width) // 2)
         y0 = header_height
 
-        # Draw day labels
-        dc.SetFont(wx.Font(13, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD))
-        dc.SetTextForeground(TEXT)
-
-        for c, day in enumerate(DAYS):
-            dc.DrawText(day, x0 + c * (cell_size + gap) + 5, y0 - 25)
-
         # Count tasks
-        month_counts = [self.day_counts.get((d.year, d.month, d.day), 0) for d in dates]
+        month_counts = [self.tiles.day(d) for d in dates]
         max_count = max(month_counts) if month_counts else 0
 
-        def get_color(count):
-            if max_count == 0:
-                return LOW
-            if count == 0:
-                return LOW
-            threshold = max(1, int(max_count * 0.4))
-            return MED if count <= threshold else HIGH
-
-        self.grid_map = []
+        cells = []
+        numbers = []
+        number_points = []
         pos = first_wd
-
-        # Draw heatmap squares
-        for d in dates:
+        for d, cnt in zip(dates, month_counts):
             col = pos % 7
             row = pos // 7
 
             x = x0 + col * (cell_size + gap)
             y = y0 + row * (cell_size + gap)
 
-            cnt = self.day_counts.get((d.year, d.month, d.day), 0)
-            color = get_color(cnt)
+            cells.append((heat_colour(cnt, max_count), (x, y, cell_size, cell_size)))
+            numbers.append(str(d.day))
+            number_points.append((x + 4, y + 4))
+            pos += 1
+
+        return {
+            "x0": x0,
+            "y0": y0,
+            "cell_size": cell_size,
+            "gap": gap,
+            "total_width": total_width,
+            "first_wd": first_wd,
+            "days_in_month": days_in_month,
+            "batches": batch_by_colour(cells),
+            "numbers": numbers,
+            "number_points": number_points,
+        }
 
-            dc.SetBrush(wx.Brush(color))
-            dc.SetPen(wx.Pen(color))
-            dc.DrawRectangle(x, y, cell_size, cell_size)
 
-            dc.SetFont(wx.Font(11, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL))
-            dc.SetTextForeground(TEXT)
-            dc.DrawText(str(d.day), x + 4, y + 4)
+    # -----------------------------------------------------
+    # PAINT — DRAW HEATMAP
+    # -----------------------------------------------------
+    def on_paint(self, evt):
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.Clear()
 
-            self.grid_map.append((wx.Rect(x, y, cell_size, cell_size), d))
-            pos += 1
+        w, h = self.GetSize()
+        if self.view_mode == "year":
+            self.paint_year_view(dc, w, h)
+            return
+
+        m = self.month_model(w, h)
+
+        x0, y0 = m["x0"], m["y0"]
+        step = m["cell_size"] + m["gap"]
+
+        # Draw day labels
+        dc.SetFont(self.day_font)
+        dc.SetTextForeground(TEXT)
+
+        for c, day in enumerate(DAYS):
+            dc.DrawText(day, x0 + c * step + 5, y0 - 25)
+
+        # Draw heatmap squares: one list call per heat level, then all day numbers
+        draw_batches(dc, m["batches"])
+        dc.SetFont(self.cell_font)
+        dc.DrawTextList(m["numbers"], m["number_points"], TEXT)
 
         # Legend
-        legend_x = x0 + total_width + 30
+        legend_x = x0 + m["total_width"] + 30
         ly = y0
 
-        dc.SetFont(wx.Font(12, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL))
+        dc.SetFont(self.legend_font)
         dc.DrawText("Legend:", legend_x, ly)
         ly += 24
 
@@ -297,16 +474,139 @@ class StudyHeatmapScreen(wx.Panel):
 
 
     # -----------------------------------------------------
-    # CLICK EVENT
+    # YEAR VIEW — one cached bitmap per year strip
     # -----------------------------------------------------
+    def year_step(self, w):
+        return max(10, min(22, int(w * 0.85 - YEAR_LABEL_W) // YEAR_WEEKS))
+
+    def year_strip_height(self, w):
+        return YEAR_HEADER_H + 7 * self.year_step(w) + YEAR_STRIP_GAP
+
+    def year_strip_x0(self, w):
+        """x of week column 0 (weekday labels sit left of it)."""
+        return (w - (YEAR_LABEL_W + YEAR_WEEKS * self.year_step(w))) // 2 + YEAR_LABEL_W
+
+    def year_strip(self, year, w):
+        if self._strips_version != self.data_version:
+            self._year_strips.clear()
+            self._strips_version = self.data_version
+
+        key = (year, self.year_step(w), w)
+        bmp = self._year_strips.get(key)
+        if bmp is None:
+            bmp = self._year_strips[key] = self.render_year_strip(year, w)
+        return bmp
+
+    def render_year_strip(self, year, w):
+        step = self.year_step(w)
+        cell = step - max(2, step // 6)
+        x0 = self.year_strip_x0(w)
+        tiles = self.tiles
+
+        bmp = wx.Bitmap(w, self.year_strip_height(w))
+        dc = wx.MemoryDC(bmp)
+        dc.SetBackground(wx.Brush(BG))
+        dc.Clear()
+        dc.SetTextForeground(TEXT)
+
+        # Year title with its total
+        dc.SetFont(self.legend_font)
+        dc.DrawText(f"{year}  •  {tiles.years.get(year, 0)} tasks", x0, 0)
+
+        # Month labels with month totals, above each month's first week
+        origin = year_grid_origin(year)
+        dc.SetFont(self.strip_font)
+        for m in range(1, 13):
+            col = (date(year, m, 1) - origin).days // 7
+            dc.DrawText(f"{calendar.month_abbr[m]} {tiles.month(year, m)}", x0 + col * step, 20)
+
+        # Weekday labels
+        for r in (0, 2, 4):
+            dc.DrawText(DAYS[r], x0 - YEAR_LABEL_W, YEAR_HEADER_H + r * step)
+
+        # Day cells: column = week since origin, row = weekday
+        max_count = tiles.year_max.get(year, 0)
+        one_day = timedelta(days=1)
+        cells = []
+        d = date(year, 1, 1)
+        while d.year == year:
+            col, row = divmod((d - origin).days, 7)
+            cells.append((heat_colour(tiles.day(d), max_count),
+                          (x0 + col * step, YEAR_HEADER_H + row * step, cell, cell)))
+            d += one_day
+        draw_batches(dc, batch_by_colour(cells))
+
+        dc.SelectObject(wx.NullBitmap)
+        return bmp
+
+    def paint_year_view(self, dc, w, h):
+        years = self.tiles.year_range(date.today())
+        strip_h = self.year_strip_height(w)
+
+        dc.SetClippingRegion(0, YEAR_TOP, w, max(0, h - YEAR_TOP))
+        for i in range(self.year_scroll // strip_h, len(years)):
+            y = YEAR_TOP + i * strip_h - self.year_scroll
+            if y >= h:
+                break
+            dc.DrawBitmap(self.year_strip(years[i], w), 0, y)
+        dc.DestroyClippingRegion()
+
+
+    # -----------------------------------------------------
+    # CLICK EVENT — cell lookup by index math
+    # -----------------------------------------------------
+    def month_cell_at(self, pt):
+        w, h = self.GetSize()
+        m = self.month_model(w, h)
+        cell = m["cell_size"]
+        step = cell + m["gap"]
+
+        dx = pt.x - m["x0"]
+        dy = pt.y - m["y0"]
+        if dx < 0 or dy < 0 or dx % step >= cell or dy % step >= cell:
+            return None
+        col, row = dx // step, dy // step
+        if col >= 7:
+            return None
+
+        day = row * 7 + col - m["first_wd"] + 1
+        if 1 <= day <= m["days_in_month"]:
+            return date(self.view_year, self.view_month, day)
+        return None
+
+    def year_cell_at(self, pt):
+        w, _ = self.GetSize()
+        if pt.y < YEAR_TOP:
+            return None
+
+        step = self.year_step(w)
+        cell = step - max(2, step // 6)
+        years = self.tiles.year_range(date.today())
+
+        i, y_in = divmod(pt.y - YEAR_TOP + self.year_scroll, self.year_strip_height(w))
+        dx = pt.x - self.year_strip_x0(w)
+        dy = y_in - YEAR_HEADER_H
+        if i >= len(years) or dx < 0 or dy < 0 or dx % step >= cell or dy % step >= cell:
+            return None
+        col, row = dx // step, dy // step
+        if col >= YEAR_WEEKS or row >= 7:
+            return None
+
+        d = year_grid_origin(years[i]) + timedelta(days=col * 7 + row)
+        return d if d.year == years[i] else None
+
     def on_click(self, evt):
         pt = evt.GetPosition()
 
-        for rect, d in self.grid_map:
-            if rect.Contains(pt):
-                cnt = self.day_counts.get((d.year, d.month, d.day), 0)
-                wx.MessageBox(
-                    f"{d.strftime('%A, %d %B %Y')}\nTasks scheduled: {cnt}",
-                    "Day Details"
-                )
-                return
+        if self.view_mode == "year":
+            d = self.year_cell_at(pt)
+        else:
+            d = self.month_cell_at(pt)
+        if d is None:
+            return
+
+        wx.MessageBox(
+            f"{d.strftime('%A, %d %B %Y')}\nTasks scheduled: {self.tiles.day(d)}"
+            f"\nThis week: {self.tiles.week(d)}  •  This month: {self.tiles.month(d.year, d.month)}",
+            "Day Details"
+        )
@@ -6,6 +6,10 @@ import math
 import time
 from datetime import datetime, date, timedelta
 
+import numpy as np
+
+from animations import AnimationTimer
+
 # ---------------- Theme colours ----------------
 BG = wx.Colour(12, 16, 22)
 ISLAND = wx.Colour(22, 28, 36)
@@ -27,6 +31,14 @@ TIMER_MS = 30
 FLOAT_AMPLITUDE = 6
 FIREWORK_LIFETIME = 1.4
 FIREWORK_PARTICLES = 12
+RAIN_DROPS = 80
+STAR_COUNT = 80
+ALPHA_LEVELS = 16         # firework fade is drawn with this many cached pens/brushes
+WAVE_PHASES = 12          # pre-rendered wave-ring variants across one swell
+STAR_TILE_W = 512         # starfield strip width; it repeats horizontally
+STAR_LAYER_SPEEDS = (24, 40)   # px/s drift of the far / near star layers
+STAR_TWINKLE_LEVELS = 4   # cached alpha variants per star layer
+STAR_TWINKLE_RATE = 1.3
 
 # ---------------- XP thresholds ----------------
 LEVEL_THRESHOLDS = [0, 50, 150, 350, 700, 1200, 2000]
@@ -40,6 +52,16 @@ def milestones_csv_path():
     base = os.path.dirname(os.path.dirname(__file__))
     return os.path.join(base, "data", "milestones.csv")
 
+def data_stamp():
+    """mtimes of tasks.csv and milestones.csv — changes when stats or nodes would."""
+    stamp = []
+    for path in (tasks_csv_path(), milestones_csv_path()):
+        try:
+            stamp.append(os.path.getmtime(path))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
 def parse_date(s):
     s = (s or "").strip()
     for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"):
@@ -180,6 +202,253 @@ def load_milestones_from_csv():
         print("load_milestones_from_csv error:", e)
     return milestones
 
+# ---------------- Particle systems ----------------
+class RainField:
+    """Rain drops as position/speed arrays, stepped vectorially and drawn as one line list."""
+
+    def __init__(self, count, w, h, seed=0):
+        self.rng = np.random.default_rng(seed)
+        i = np.arange(count)
+        self.pos = np.empty((count, 2), dtype=np.float32)
+        self.pos[:, 0] = (i * 37) % max(200, w)
+        self.pos[:, 1] = (i * 29) % max(200, h)
+        self.speed = (200 + (i % 5) * 40).astype(np.float32)
+        self.pen = wx.Pen(RAIN_COL, 2)
+
+    def step(self, dt, w, h):
+        y = self.pos[:, 1]
+        y += self.speed * dt
+        fell = y > h
+        n = int(np.count_nonzero(fell))
+        if n:
+            y[fell] = -10
+            self.pos[fell, 0] = self.rng.uniform(0, max(200, w), n)
+
+    def draw(self, dc):
+        xy = self.pos.astype(np.int32)
+        lines = np.concatenate((xy, xy + (4, 12)), axis=1)
+        dc.DrawLineList(lines.tolist(), self.pen)
+
+
+class StarField:
+    """
+    Stars pre-rendered into tileable strips, one per parallax layer, each in a
+    few alpha variants for twinkle. A frame is a constant number of blits per
+    layer however many stars there are.
+    """
+
+    def __init__(self, count, seed=0):
+        rng = np.random.default_rng(seed)
+        i = np.arange(count)
+        self.layers = []
+        for near in (False, True):
+            # every third star is a big, near one (as before); far ones drift slower
+            sel = (i % 3 == 0) == near
+            n = int(np.count_nonzero(sel))
+            self.layers.append({
+                "x": rng.uniform(0, STAR_TILE_W, n),
+                "y": rng.uniform(0, 1, n),
+                "radius": 2 if near else 1,
+                "speed": STAR_LAYER_SPEEDS[near],
+                "phase": math.pi if near else 0.0,
+            })
+        self.tile_h = None
+        self.tiles = []           # per layer: [bitmap per twinkle level]
+
+    def _render_tiles(self, tile_h):
+        self.tile_h = tile_h
+        self.tiles = []
+        for layer in self.layers:
+            variants = []
+            for lvl in range(STAR_TWINKLE_LEVELS):
+                alpha = int(STAR_COL.Alpha() * (0.45 + 0.55 * lvl / (STAR_TWINKLE_LEVELS - 1)))
+                variants.append(self._render_tile(layer, tile_h, alpha))
+            self.tiles.append(variants)
+
+    def _render_tile(self, layer, tile_h, alpha):
+        bmp = wx.Bitmap.FromRGBA(STAR_TILE_W, tile_h, 0, 0, 0, 0)
+        mem = wx.MemoryDC(bmp)
+        gc = wx.GraphicsContext.Create(mem)
+        if gc:
+            col = wx.Colour(STAR_COL.Red(), STAR_COL.Green(), STAR_COL.Blue(), alpha)
+            gc.SetBrush(gc.CreateBrush(wx.Brush(col)))
+            gc.SetPen(wx.TRANSPARENT_PEN)
+            r = layer["radius"]
+            for x, y in zip(layer["x"], layer["y"] * tile_h):
+                # stars straddling an edge are drawn on both sides so the strip tiles seamlessly
+                for dx in (-STAR_TILE_W, 0, STAR_TILE_W):
+                    gc.DrawEllipse(x + dx - r, y - r, 2 * r, 2 * r)
+            del gc
+        mem.SelectObject(wx.NullBitmap)
+        return bmp
+
+    def release(self):
+        """Drop the rendered strips; they are rebuilt on the next draw."""
+        self.tile_h = None
+        self.tiles = []
+
+    def draw(self, dc, w, h, t):
+        tile_h = max(1, h // 2)
+        if tile_h != self.tile_h:
+            self._render_tiles(tile_h)
+
+        for layer, variants in zip(self.layers, self.tiles):
+            twinkle = 0.5 + 0.5 * math.sin(t * STAR_TWINKLE_RATE + layer["phase"])
+            bmp = variants[min(STAR_TWINKLE_LEVELS - 1, int(twinkle * STAR_TWINKLE_LEVELS))]
+            x = int(t * layer["speed"]) % STAR_TILE_W - STAR_TILE_W
+            while x < w:
+                dc.DrawBitmap(bmp, x, 0, True)
+                x += STAR_TILE_W
+
+
+class FireworkBursts:
+    """Firework bursts as origin/start-time arrays; every particle is computed at once."""
+
+    def __init__(self):
+        self.origin = np.empty((0, 2), dtype=np.float32)
+        self.t0 = np.empty(0, dtype=np.float64)
+        self.angles = np.arange(FIREWORK_PARTICLES) * (2 * math.pi / FIREWORK_PARTICLES)
+        self.pens = []
+        self.brushes = []
+        for lvl in range(ALPHA_LEVELS):
+            col = wx.Colour(255, 200, 80, max(40, int(255 * (lvl + 1) / ALPHA_LEVELS)))
+            self.pens.append(wx.Pen(col))
+            self.brushes.append(wx.Brush(col))
+
+    def __len__(self):
+        return len(self.t0)
+
+    def add(self, x, y, t):
+        self.origin = np.vstack((self.origin, np.array([[x, y]], dtype=np.float32)))
+        self.t0 = np.append(self.t0, t)
+
+    def draw(self, dc, now, view_x):
+        if not len(self.t0):
+            return
+        age = now - self.t0
+        live = age <= FIREWORK_LIFETIME
+        if not live.all():
+            self.origin, self.t0, age = self.origin[live], self.t0[live], age[live]
+            if not len(self.t0):
+                return
+
+        prog = age / FIREWORK_LIFETIME                                  # (F,)
+        ang = self.angles[None, :] + prog[:, None] * 4.0                # (F, P)
+        r = (6 + prog * 40)[:, None]
+        px = (self.origin[:, 0:1] + np.cos(ang) * r - view_x).astype(np.int32)
+        py = (self.origin[:, 1:2] + np.sin(ang) * r).astype(np.int32)
+        rad = np.broadcast_to(np.maximum(2, (3 * (1 - prog)).astype(np.int32))[:, None], px.shape)
+        rects = np.stack((px - rad, py - rad, 2 * rad, 2 * rad), axis=2)
+
+        # one list draw per fade level, with cached pens/brushes
+        levels = np.minimum(ALPHA_LEVELS - 1, ((1 - prog) * ALPHA_LEVELS).astype(np.int32))
+        for lvl in np.unique(levels):
+            group = rects[levels == lvl].reshape(-1, 4)
+            dc.DrawEllipseList(group.tolist(), self.pens[lvl], self.brushes[lvl])
+
+
+# ---------------- Island sprites ----------------
+SKIN_COLOURS = {
+    "tropical": (wx.Colour(22,28,36), wx.Colour(24,40,56)),
+    "lava": (wx.Colour(36,18,18), wx.Colour(56,22,22)),
+    "ice": (wx.Colour(18,28,36), wx.Colour(34,44,66)),
+    "forest": (wx.Colour(20,34,22), wx.Colour(32,50,36)),
+    "desert": (wx.Colour(38,34,20), wx.Colour(56,48,24)),
+    "cloud": (wx.Colour(28,30,36), wx.Colour(44,44,50)),
+}
+PALM = wx.Colour(30, 180, 80)
+
+# Island parts rendered once and shared by every JourneyMapScreen instance.
+# key: (part, wbox, hbox, variant) -> (wx.Bitmap, dx, dy), where (dx, dy) is
+# the bitmap's top-left relative to the island centre.
+_island_sprites = {}
+_ISLAND_CACHE_MAX = 64
+SPRITE_PAD = 2            # room for pens / the palm poking above the body
+
+
+def _sprite_canvas(w, h):
+    bmp = wx.Bitmap.FromRGBA(w, h, 0, 0, 0, 0)
+    mem = wx.MemoryDC(bmp)
+    return bmp, mem, wx.GraphicsContext.Create(mem)
+
+
+def _render_island_shadow(wbox, hbox):
+    w, h = wbox + 20, 32
+    bmp, mem, gc = _sprite_canvas(w + 2 * SPRITE_PAD, h + 2 * SPRITE_PAD)
+    if gc:
+        gc.SetBrush(gc.CreateBrush(wx.Brush(wx.Colour(0,0,0,30))))
+        gc.SetPen(gc.CreatePen(wx.GraphicsPenInfo(wx.Colour(0,0,0,40))))
+        gc.DrawEllipse(SPRITE_PAD, SPRITE_PAD, w, h)
+        del gc
+    mem.SelectObject(wx.NullBitmap)
+    return bmp, -wbox//2 - 8 - SPRITE_PAD, hbox//2 + 6 - SPRITE_PAD
+
+
+def _render_island_body(wbox, hbox, skin):
+    """Body, overlay and palm — everything that bobs with float_offset."""
+    col1, _ = SKIN_COLOURS.get(skin, (ISLAND, ISLAND))
+    p = SPRITE_PAD
+    bmp, mem, gc = _sprite_canvas(wbox + 2 * p, hbox + 2 * p)
+    if gc:
+        gc.SetBrush(gc.CreateBrush(wx.Brush(col1)))
+        gc.SetPen(gc.CreatePen(wx.GraphicsPenInfo(wx.Colour(0,0,0,40))))
+        gc.DrawRoundedRectangle(p, p, wbox, hbox, 28)
+
+        gc.SetBrush(gc.CreateBrush(wx.Brush(OVERLAY)))
+        gc.SetPen(wx.TRANSPARENT_PEN)
+        gc.DrawRoundedRectangle(p + 10, p + 10, wbox - 20, hbox - 30, 18)
+
+        # little palm
+        px, py = p + wbox - 30, p + 10
+        gc.SetBrush(gc.CreateBrush(wx.Brush(PALM)))
+        gc.SetPen(gc.CreatePen(wx.GraphicsPenInfo(PALM)))
+        for cx, cy, r in ((px, py, 6), (px + 8, py - 6, 5), (px - 8, py - 6, 5)):
+            gc.DrawEllipse(cx - r, cy - r, 2 * r, 2 * r)
+        del gc
+    mem.SelectObject(wx.NullBitmap)
+    return bmp, -wbox//2 - p, -hbox//2 - p
+
+
+def _render_wave_ring(wbox, hbox, phase):
+    """Wave ring at one of WAVE_PHASES points of its swell (radius and alpha)."""
+    theta = 2 * math.pi * phase / WAVE_PHASES
+    radius = int(wbox//2 + 6 + 6 * math.sin(theta))
+    alpha = int(60 + 60 * (0.5 + 0.5 * math.sin(theta)))
+    half = radius + SPRITE_PAD
+    bmp, mem, gc = _sprite_canvas(2 * half, 2 * half)
+    if gc:
+        info = wx.GraphicsPenInfo(wx.Colour(0, 120, 160, alpha)).Width(2).Cap(wx.CAP_ROUND)
+        gc.SetPen(gc.CreatePen(info))
+        path = gc.CreatePath()
+        path.AddCircle(half, half, radius)
+        gc.StrokePath(path)
+        del gc
+    mem.SelectObject(wx.NullBitmap)
+    return bmp, -half, hbox//2 - 6 - half
+
+
+_ISLAND_RENDERERS = {
+    "shadow": lambda wbox, hbox, _: _render_island_shadow(wbox, hbox),
+    "body": _render_island_body,
+    "wave": _render_wave_ring,
+}
+
+
+def island_sprite(part, wbox, hbox, variant=None):
+    key = (part, wbox, hbox, variant)
+    entry = _island_sprites.get(key)
+    if entry is None:
+        if len(_island_sprites) >= _ISLAND_CACHE_MAX:
+            _island_sprites.clear()
+        entry = _island_sprites[key] = _ISLAND_RENDERERS[part](wbox, hbox, variant)
+    return entry
+
+
+def wave_phase(t, x):
+    """Quantised swell phase of the ring around the island at screen x."""
+    return int((t * 1.8 + x * 0.02) / (2 * math.pi) * WAVE_PHASES) % WAVE_PHASES
+
+
 # ---------------- Journey Map Screen ----------------
 class JourneyMapScreen(wx.Panel):
     def __init__(self, parent, nav_callback=None, back_callback=None):
@@ -210,6 +479,7 @@ class JourneyMapScreen(wx.Panel):
 
 
         # ---------- dynamic data ----------
+        self.loaded_stamp = data_stamp()
         self.milestones = load_milestones_from_csv()
         self.stats = compute_stats()
         self.stats["streak"] = compute_streak(self.stats["dates_with_completed"])
@@ -230,7 +500,8 @@ class JourneyMapScreen(wx.Panel):
         self.view_x_start = 0
 
         # ---------- effects (must initialize BEFORE building nodes) ----------
-        self.fireworks = []
+        self.fireworks = FireworkBursts()
+        self.stars = StarField(STAR_COUNT)
         self.weather = "none"
 
         # prepare nodes from milestones (safe to append fireworks now)
@@ -244,7 +515,7 @@ class JourneyMapScreen(wx.Panel):
         self.avatar_t = min(1.0, (self.xp / max(1, LEVEL_THRESHOLDS[-1])))
 
         # timer
-        self.timer = wx.Timer(self)
+        self.timer = AnimationTimer(self)
         self.Bind(wx.EVT_TIMER, self._on_timer, self.timer)
         self.timer.Start(TIMER_MS)
 
@@ -336,32 +607,23 @@ class JourneyMapScreen(wx.Panel):
 
             if just_unlocked:
                 # safe: self.fireworks already exists
-                self.fireworks.append({"x": x, "y": y - 30, "t": now})
+                self.fireworks.add(x, y - 30, now)
 
     # ---------------- Rain prep ----------------
     def _prepare_rain_particles(self):
-        self.rain = []
         w = max(600, int(self.map_width // 3))
         h = max(400, self.map_height)
-        for i in range(80):
-            self.rain.append({
-                "x": int((i * 37) % max(200, w)),
-                "y": int((i * 29) % max(200, h)),
-                "speed": 200 + (i % 5) * 40
-            })
+        self.rain = RainField(RAIN_DROPS, w, h)
 
     # ---------------- Timer tick ----------------
     def _on_timer(self, evt):
-        dt = TIMER_MS / 1000.0
+        # actual interval: the animation policy slows the timer while unfocused
+        dt = self.timer.GetInterval() / 1000.0
         if self.weather == "rain":
             w, h = self.GetSize()
-            for p in self.rain:
-                p["y"] += int(p["speed"] * dt)
-                if p["y"] > h:
-                    p["y"] = -10
-                    p["x"] = int(time.time() * 31) % max(200, w)
+            self.rain.step(dt, w, h)
         target_t = min(1.0, (self.xp / max(1, LEVEL_THRESHOLDS[-1])))
-        self.avatar_t += (target_t - self.avatar_t) * 0.08
+        self.avatar_t += (target_t - self.avatar_t) * (1 - 0.92 ** (dt * 1000 / TIMER_MS))
         self.Refresh()
 
     # ---------------- Mouse / keyboard ----------------
@@ -441,63 +703,18 @@ class JourneyMapScreen(wx.Panel):
             wx.MessageBox(f"Congratulations — {node['title']} completed! 🎉", "Celebration", wx.OK | wx.ICON_INFORMATION)
 
     # ---------------- Drawing helpers ----------------
-    def _skin_colors(self, skin):
-        mapping = {
-            "tropical": (wx.Colour(22,28,36), wx.Colour(24,40,56)),
-            "lava": (wx.Colour(36,18,18), wx.Colour(56,22,22)),
-            "ice": (wx.Colour(18,28,36), wx.Colour(34,44,66)),
-            "forest": (wx.Colour(20,34,22), wx.Colour(32,50,36)),
-            "desert": (wx.Colour(38,34,20), wx.Colour(56,48,24)),
-            "cloud": (wx.Colour(28,30,36), wx.Colour(44,44,50)),
-        }
-        return mapping.get(skin, (ISLAND, ISLAND))
-
     def _draw_island(self, dc, x, y, wbox=220, hbox=120, float_offset=0, glow_alpha=0, skin="tropical"):
-        # shadow
-        dc.SetBrush(wx.Brush(wx.Colour(0,0,0,30)))
-        dc.SetPen(wx.Pen(wx.Colour(0,0,0,40)))
-        dc.DrawEllipse(int(x - wbox//2 - 8), int(y + hbox//2 + 6), int(wbox + 20), 32)
-
-        # island body
-        col1, col2 = self._skin_colors(skin)
-        dc.SetBrush(wx.Brush(col1))
-        dc.SetPen(wx.Pen(wx.Colour(0,0,0,40)))
-        dc.DrawRoundedRectangle(int(x - wbox//2), int(y - hbox//2 + float_offset), int(wbox), int(hbox), 28)
-
-        # overlay
-        dc.SetBrush(wx.Brush(OVERLAY))
-        dc.SetPen(wx.Pen(wx.Colour(0,0,0,0)))
-        dc.DrawRoundedRectangle(int(x - wbox//2 + 10), int(y - hbox//2 + 10 + float_offset), int(wbox - 20), int(hbox - 30), 18)
+        # pre-rendered parts (see island_sprite): shadow stays on the water,
+        # the body bobs with float_offset, the wave ring swells in phases
+        bmp, dx, dy = island_sprite("shadow", wbox, hbox)
+        dc.DrawBitmap(bmp, int(x + dx), int(y + dy), True)
+
+        bmp, dx, dy = island_sprite("body", wbox, hbox, skin if skin in SKIN_COLOURS else None)
+        dc.DrawBitmap(bmp, int(x + dx), int(y + dy + float_offset), True)
 
-        # little palm
-        px = int(x + wbox//2 - 30)
-        py = int(y - hbox//2 + 10 + float_offset)
-        dc.SetPen(wx.Pen(wx.Colour(30, 180, 80)))
-        dc.SetBrush(wx.Brush(wx.Colour(30, 180, 80)))
-        dc.DrawCircle(px, py, 6)
-        dc.DrawCircle(px+8, py-6, 5)
-        dc.DrawCircle(px-8, py-6, 5)
-
-        # animated wave ring (try GraphicsContext, fallback to DC)
         t = time.time() - getattr(self, "time0", time.time())
-        g = wx.GraphicsContext.Create(dc)
-        if g:
-            wave_alpha = int(60 + 60 * (0.5 + 0.5 * math.sin(t*1.2 + x*0.01)))
-            info = wx.GraphicsPenInfo(wx.Colour(0, 120, 160, wave_alpha)).Width(2).Cap(wx.CAP_ROUND)
-            try:
-                pen = g.CreatePen(info)
-                g.SetPen(pen)
-                path = g.CreatePath()
-                path.AddCircle(x, y + hbox//2 - 6, int(wbox//2 + 6 + 6 * math.sin(t*1.8 + x*0.02)))
-                g.StrokePath(path)
-            except Exception:
-                dc.SetPen(wx.Pen(wx.Colour(0, 120, 160, wave_alpha), 2))
-                dc.SetBrush(wx.TRANSPARENT_BRUSH)
-                dc.DrawCircle(x, y + hbox//2 - 6, int(wbox//2 + 6 + 6 * math.sin(t*1.8 + x*0.02)))
-        else:
-            dc.SetPen(wx.Pen(wx.Colour(0, 120, 160, 120), 2))
-            dc.SetBrush(wx.TRANSPARENT_BRUSH)
-            dc.DrawCircle(x, y + hbox//2 - 6, int(wbox//2 + 6 + 6 * math.sin(t*1.8 + x*0.02)))
+        bmp, dx, dy = island_sprite("wave", wbox, hbox, wave_phase(t, x))
+        dc.DrawBitmap(bmp, int(x + dx), int(y + dy), True)
 
     def _draw_bridge(self, dc, x1, y1, x2, y2):
         # straight bridge between islands, leaving margins so bridge meets island edges nicely
@@ -674,38 +891,13 @@ class JourneyMapScreen(wx.Panel):
         self._draw_avatar(dc, avatar_x, avatar_y)
 
         # fireworks
-        nowt = time.time()
-        new_f = []
-        for f in self.fireworks:
-            age = nowt - f["t"]
-            if age > FIREWORK_LIFETIME:
-                continue
-            prog = age / FIREWORK_LIFETIME
-            for p in range(FIREWORK_PARTICLES):
-                ang = p * (2*math.pi / FIREWORK_PARTICLES) + prog * 4.0
-                r = 6 + prog * 40
-                px = int(f["x"] + math.cos(ang) * r - self.view_x)
-                py = int(f["y"] + math.sin(ang) * r)
-                alpha = int(255 * (1 - prog))
-                col = wx.Colour(255, 200, 80, max(40, alpha))
-                dc.SetPen(wx.Pen(col))
-                dc.SetBrush(wx.Brush(col))
-                dc.DrawCircle(px, py, max(2, int(3*(1-prog))))
-            new_f.append(f)
-        self.fireworks = new_f
+        self.fireworks.draw(dc, time.time(), self.view_x)
 
         # weather overlay
         if self.weather == "rain":
-            for p in self.rain:
-                dc.SetPen(wx.Pen(RAIN_COL, 2))
-                dc.DrawLine(p["x"], p["y"], p["x"]+4, p["y"]+12)
+            self.rain.draw(dc)
         elif self.weather == "stars":
-            for i in range(80):
-                sx = (i * 43 + int(time.time()*40)) % (w+200) - 50
-                sy = (i * 73) % (h//2)
-                dc.SetPen(wx.Pen(STAR_COL, 1))
-                dc.SetBrush(wx.Brush(STAR_COL))
-                dc.DrawCircle(int(sx), int(sy), (i%3==0 and 2) or 1)
+            self.stars.draw(dc, w, h, time.time())
 
         # bottom UI
         self._draw_weekly_timeline(dc, w, h)
@@ -774,7 +966,21 @@ class JourneyMapScreen(wx.Panel):
         dc.DrawText(txt, int(x + 8), int(y - th - 4))
 
     # ---------------- public refresh API ----------------
+    # ---------------- Suspend / resume (MainFrame screen cache) ----------------
+    def suspend(self):
+        self.timer.Stop()
+        self.stars.release()
+        if self.dragging and self.HasCapture():
+            self.ReleaseMouse()
+        self.dragging = False
+
+    def resume(self):
+        if data_stamp() != self.loaded_stamp:
+            self.refresh_stats_and_nodes()
+        self.timer.Start(TIMER_MS)
+
     def refresh_stats_and_nodes(self):
+        self.loaded_stamp = data_stamp()
         # reload stats
         self.stats = compute_stats()
         self.stats["streak"] = compute_streak(self.stats["dates_with_completed"])
@@ -795,5 +1001,5 @@ class JourneyMapScreen(wx.Panel):
         now = time.time()
         for n in self.nodes:
             if n["state"] == "completed":
-                self.fireworks.append({"x": n["x"], "y": n["y"] - 30, "t": now})
+                self.fireworks.add(n["x"], n["y"] - 30, now)
         self.Refresh()
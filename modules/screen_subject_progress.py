@@ -11,6 +11,78 @@ NEON = wx.Colour(0, 200, 255)
 GLOW = wx.Colour(0, 200, 255)
 TEXT = wx.Colour(220, 230, 240)
 
+# ---------------- GRID LAYOUT ----------------
+COLUMNS = 3
+RING_RADIUS = 90
+GRID_TOP = 180            # cy of the first row
+ROW_GAP = 320
+LABEL_REACH = 60          # label text below the ring (radius + 20 + text height)
+
+# ---------------- RING SPRITES ----------------
+RING_MARGIN = 24          # room for the widest glow stroke around the ring
+
+# (radius, pct) -> wx.Bitmap, shared by every SubjectProgressScreen
+_ring_sprites = {}
+_RING_CACHE_MAX = 256
+
+
+def _render_ring(radius, pct):
+    """Rasterise the back ring, glow passes, arc and percent into one alpha bitmap."""
+    size = 2 * (radius + RING_MARGIN)
+    c = size / 2
+    bmp = wx.Bitmap.FromRGBA(size, size, 0, 0, 0, 0)
+    mem = wx.MemoryDC(bmp)
+    gc = wx.GraphicsContext.Create(mem)
+
+    if gc:
+        # BACK RING
+        bg_pen = gc.CreatePen(wx.GraphicsPenInfo(RING_BG).Width(18).Cap(wx.CAP_ROUND))
+        gc.SetPen(bg_pen)
+        pbg = gc.CreatePath()
+        pbg.AddCircle(c, c, radius)
+        gc.StrokePath(pbg)
+
+        # GLOW
+        for i in range(4):
+            alpha = 50 - i * 10
+            col = wx.Colour(GLOW.Red(), GLOW.Green(), GLOW.Blue(), alpha)
+            pen = gc.CreatePen(wx.GraphicsPenInfo(col).Width(26 + i * 4).Cap(wx.CAP_ROUND))
+            gc.SetPen(pen)
+            ph = gc.CreatePath()
+            ph.AddCircle(c, c, radius)
+            gc.StrokePath(ph)
+
+        # ARC
+        angle = (pct / 100.0) * 360
+        start = -90
+        arc_pen = gc.CreatePen(wx.GraphicsPenInfo(NEON).Width(12).Cap(wx.CAP_ROUND))
+        gc.SetPen(arc_pen)
+
+        pa = gc.CreatePath()
+        pa.AddArc(c, c, radius, math.radians(start), math.radians(start + angle), False)
+        gc.StrokePath(pa)
+
+        # PERCENT
+        gc.SetFont(wx.Font(22, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD), TEXT)
+        t = f"{pct}%"
+        tw, th = gc.GetTextExtent(t)
+        gc.DrawText(t, c - tw / 2, c - th / 2)
+
+    del gc
+    mem.SelectObject(wx.NullBitmap)
+    return bmp
+
+
+def ring_sprite(radius, pct):
+    """Cached ring bitmap (RING_MARGIN px of glow around `radius`)."""
+    key = (radius, pct)
+    bmp = _ring_sprites.get(key)
+    if bmp is None:
+        if len(_ring_sprites) >= _RING_CACHE_MAX:
+            _ring_sprites.clear()
+        bmp = _ring_sprites[key] = _render_ring(radius, pct)
+    return bmp
+
 
 class SubjectProgressScreen(wx.Panel):
 
@@ -45,7 +117,13 @@ class SubjectProgressScreen(wx.Panel):
         self.inner.SetBackgroundStyle(wx.BG_STYLE_PAINT)
 
         # Load percentages
+        self.loaded_mtime = self.tasks_csv_mtime()
         self.subject_progress = self.load_subject_percentages()
+        self.subject_items = list(self.subject_progress.items())
+
+        # Fonts (created once, reused on every paint)
+        self.title_font = wx.Font(36, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        self.label_font = wx.Font(14, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
 
         # Bind painting to INNER panel (IMPORTANT FIX)
         self.inner.Bind(wx.EVT_PAINT, self.on_paint_inner)
@@ -77,12 +155,31 @@ class SubjectProgressScreen(wx.Panel):
         if self.back_callback:
             self.back_callback()
 
+    def resume(self):
+        # back from MainFrame's screen cache: reload only if tasks.csv changed
+        mtime = self.tasks_csv_mtime()
+        if mtime != self.loaded_mtime:
+            self.loaded_mtime = mtime
+            self.subject_progress = self.load_subject_percentages()
+            self.subject_items = list(self.subject_progress.items())
+            self.refresh_inner_size()
+            self.inner.Refresh()
+
     # ---------------------------------------------------------
     # CSV READING
     # ---------------------------------------------------------
-    def load_subject_percentages(self):
+    def tasks_csv_path(self):
         base = os.path.dirname(os.path.dirname(__file__))
-        csv_path = os.path.join(base, "data", "tasks.csv")
+        return os.path.join(base, "data", "tasks.csv")
+
+    def tasks_csv_mtime(self):
+        try:
+            return os.path.getmtime(self.tasks_csv_path())
+        except OSError:
+            return None
+
+    def load_subject_percentages(self):
+        csv_path = self.tasks_csv_path()
 
         if not os.path.exists(csv_path):
             return {"No Data": 0}
@@ -123,45 +220,14 @@ class SubjectProgressScreen(wx.Panel):
     # ---------------------------------------------------------
     def draw_neon_ring(self, dc, cx, cy, radius, pct, label):
 
-        gc = wx.GraphicsContext.Create(dc)
-
-        # BACK RING
-        bg_pen = gc.CreatePen(wx.GraphicsPenInfo(RING_BG).Width(18).Cap(wx.CAP_ROUND))
-        gc.SetPen(bg_pen)
-        pbg = gc.CreatePath()
-        pbg.AddCircle(cx, cy, radius)
-        gc.StrokePath(pbg)
-
-        # GLOW
-        for i in range(4):
-            alpha = 50 - i * 10
-            col = wx.Colour(GLOW.Red(), GLOW.Green(), GLOW.Blue(), alpha)
-            pen = gc.CreatePen(wx.GraphicsPenInfo(col).Width(26 + i * 4).Cap(wx.CAP_ROUND))
-            gc.SetPen(pen)
-            ph = gc.CreatePath()
-            ph.AddCircle(cx, cy, radius)
-            gc.StrokePath(ph)
-
-        # ARC
-        angle = (pct / 100.0) * 360
-        start = -90
-        arc_pen = gc.CreatePen(wx.GraphicsPenInfo(NEON).Width(12).Cap(wx.CAP_ROUND))
-        gc.SetPen(arc_pen)
-
-        pa = gc.CreatePath()
-        pa.AddArc(cx, cy, radius, math.radians(start), math.radians(start + angle), False)
-        gc.StrokePath(pa)
-
-        # PERCENT
-        dc.SetTextForeground(TEXT)
-        dc.SetFont(wx.Font(22, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-
-        t = f"{pct}%"
-        tw, th = dc.GetTextExtent(t)
-        dc.DrawText(t, cx - tw // 2, cy - th // 2)
+        # RING + GLOW + PERCENT (cached sprite)
+        bmp = ring_sprite(radius, pct)
+        half = bmp.GetWidth() // 2
+        dc.DrawBitmap(bmp, cx - half, cy - half, True)
 
         # LABEL
-        dc.SetFont(wx.Font(14, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        dc.SetTextForeground(TEXT)
+        dc.SetFont(self.label_font)
         lw, lh = dc.GetTextExtent(label)
         dc.DrawText(label, cx - lw // 2, cy + radius + 20)
 
@@ -173,29 +239,42 @@ class SubjectProgressScreen(wx.Panel):
         dc.Clear()
 
         w, h = self.inner.GetSize()
+        top, bottom = self.visible_band()
 
         # TITLE
-        dc.SetTextForeground(wx.Colour(180, 220, 255))
-        dc.SetFont(wx.Font(36, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-        dc.DrawText("📊 Subject-Wise Progress", 40, 30)
-
-        items = list(self.subject_progress.items())
-        n = len(items)
-
-        columns = 3
-        radius = 90
-        spacing_x = w // (columns + 1)
-
-        start_y = 180
-        row_gap = 320
-
-        positions = []
-        for i in range(n):
-            row = i // columns
-            col = i % columns
-            cx = spacing_x * (col + 1)
-            cy = start_y + (row * row_gap)
-            positions.append((cx, cy))
-
-        for (subject, pct), (cx, cy) in zip(items, positions):
-            self.draw_neon_ring(dc, cx, cy, radius, pct, subject)
+        if top < 100:
+            dc.SetTextForeground(wx.Colour(180, 220, 255))
+            dc.SetFont(self.title_font)
+            dc.DrawText("📊 Subject-Wise Progress", 40, 30)
+
+        items = self.subject_items
+        spacing_x = w // (COLUMNS + 1)
+
+        # Only the rows whose ring or label reaches into [top, bottom)
+        for i in self.visible_indices(top, bottom, len(items)):
+            subject, pct = items[i]
+            cx = spacing_x * (i % COLUMNS + 1)
+            cy = GRID_TOP + (i // COLUMNS) * ROW_GAP
+            self.draw_neon_ring(dc, cx, cy, RING_RADIUS, pct, subject)
+
+    def visible_band(self):
+        """Inner-panel y range to paint: the scrolled viewport clipped to the update region."""
+        _, top = self.scroll.CalcUnscrolledPosition(0, 0)
+        bottom = top + self.scroll.GetClientSize().height
+
+        box = self.inner.GetUpdateRegion().GetBox()
+        if not box.IsEmpty():
+            top = max(top, box.GetTop())
+            bottom = min(bottom, box.GetBottom() + 1)
+        return top, bottom
+
+    @staticmethod
+    def visible_indices(top, bottom, count):
+        """Indices of the subjects whose rows overlap [top, bottom)."""
+        reach_up = RING_RADIUS + RING_MARGIN
+        reach_down = RING_RADIUS + LABEL_REACH
+        first_row = max(0, -(-(top - reach_down - GRID_TOP) // ROW_GAP))
+        last_row = (bottom + reach_up - GRID_TOP) // ROW_GAP
+        if last_row < first_row:
+            return range(0)
+        return range(first_row * COLUMNS, min(count, (last_row + 1) * COLUMNS))
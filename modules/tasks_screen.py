@@ -7,6 +7,7 @@ import wx.adv
 import wx.lib.scrolledpanel as scrolled
 import datetime
 import csv
+import heapq
 import os
 
 # ============================
@@ -22,6 +23,11 @@ HOUR_HEIGHT = 72
 
 GRID_COL_GAP = 30
 DAY_COL_COUNT = 7
+DAY_COL_W = 150
+GRID_LEFT_MARGIN = 40
+GRID_TOP_MARGIN = 10
+EVENT_PAD = 6                 # event block inset from its day column
+SUBCOL_GAP = 4                # gap between side-by-side overlapping events
 
 # Colors
 BG = wx.Colour(18, 24, 34)
@@ -36,12 +42,64 @@ EVENT_COLORS = [
     wx.Colour(255, 190, 150),
     wx.Colour(120, 255, 220),
 ]
+EVENT_TEXT = wx.Colour(10, 10, 10)
+COMPLETED_FILL = wx.Colour(120, 124, 130)
+COMPLETED_TEXT = wx.Colour(200, 200, 205)
+COMPLETED_NOTE = wx.Colour(170, 170, 175)
+
+
+def overlap_columns(spans):
+    """
+    Sweep-line layout of one day's events, O(n log n).
+
+    spans: list of (top, bottom). Returns (column, columns) per span, where
+    columns is the width of the overlap cluster the span belongs to, so
+    parallel blocks share the day column side by side.
+    """
+    order = sorted(range(len(spans)), key=lambda i: spans[i])
+    result = [None] * len(spans)
+
+    active = []        # heap of (bottom, column) still open at the sweep line
+    free = []          # heap of columns released inside the current cluster
+    cluster = []       # indices in the current cluster
+    width = 0
+
+    def close_cluster():
+        for j in cluster:
+            result[j] = (result[j][0], width)
+
+    for i in order:
+        top, bottom = spans[i]
+        while active and active[0][0] <= top:
+            heapq.heappush(free, heapq.heappop(active)[1])
+        if not active:
+            # nothing overlaps any more: the previous cluster is complete
+            close_cluster()
+            cluster, free, width = [], [], 0
+
+        col = heapq.heappop(free) if free else width
+        width = max(width, col + 1)
+        heapq.heappush(active, (bottom, col))
+        cluster.append(i)
+        result[i] = (col, 0)
+
+    close_cluster()
+    return result
+
 
 CSV_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "data", "tasks.csv")
 )
 
 
+def csv_mtime():
+    """tasks.csv modification time (None if missing); tells resume() whether to reload."""
+    try:
+        return os.path.getmtime(CSV_PATH)
+    except OSError:
+        return None
+
+
 # ============================================================
 # ColorPicker Widget — small circular color bubbles
 # ============================================================
@@ -117,6 +175,21 @@ class TasksScreen(wx.Panel):
         self.week_start = today - datetime.timedelta(days=today.weekday())
 
         self.events = self.load_tasks_from_csv()
+        self.events_version = 0
+        self.loaded_mtime = csv_mtime()
+
+        # paint caches (see grid_background / week_events)
+        self._grid_bg = None
+        self._grid_bg_key = None
+        self._week_events = []
+        self._week_events_key = None
+        self._week_layout = []
+        self._week_layout_key = None
+
+        self.event_font = wx.Font(10, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.event_note_font = wx.Font(8, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
+        self.day_font = wx.Font(10, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD)
+        self.hour_font = wx.Font(9, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL)
 
         self.build_ui()
         wx.CallAfter(self.recalc_grid_size)
@@ -170,6 +243,8 @@ class TasksScreen(wx.Panel):
         return events
 
     def save_tasks_to_csv(self):
+        # every edit to self.events is saved, so this marks week caches stale
+        self.events_version += 1
         try:
             os.makedirs(os.path.dirname(CSV_PATH), exist_ok=True)
             with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
@@ -187,9 +262,26 @@ class TasksScreen(wx.Panel):
                             ev.get("completed", False),
                         ]
                     )
+            self.loaded_mtime = csv_mtime()
         except Exception as e:
             print("CSV save error:", e)
 
+    # ======================================================
+    # SUSPEND / RESUME (MainFrame keeps recent screens alive)
+    # ======================================================
+    def suspend(self):
+        # a full-size bitmap; cheap to re-render on the next paint
+        self._grid_bg = None
+        self._grid_bg_key = None
+
+    def resume(self):
+        # pick up edits other screens made to tasks.csv since we last read or wrote it
+        if csv_mtime() != self.loaded_mtime:
+            self.events = self.load_tasks_from_csv()
+            self.events_version += 1
+            self.loaded_mtime = csv_mtime()
+            self.grid_panel.Refresh()
+
     # ======================================================
     # UI STRUCTURE
     # ======================================================
@@ -359,87 +451,164 @@ class TasksScreen(wx.Panel):
     def on_paint_grid(self, evt):
         dc = wx.AutoBufferedPaintDC(self.grid_panel)
 
+        w, h = self.grid_panel.GetSize()
+
+        # Day columns + hour lines (cached per week and size)
+        dc.DrawBitmap(self.grid_background(w, h), 0, 0)
+
+        # Draw events that intersect the damaged area
+        box = self.grid_panel.GetUpdateRegion().GetBox()
+        if box.IsEmpty():
+            box = wx.Rect(0, 0, w, h)
+        top, bottom = box.GetTop(), box.GetBottom()
+
+        visible = [(ev, rect) for ev, rect in self.week_layout()
+                   if rect.GetBottom() >= top and rect.GetTop() <= bottom]
+        self.draw_events(dc, visible)
+
+    def grid_background(self, w, h):
+        key = (self.week_start, w, h)
+        if self._grid_bg_key != key:
+            self._grid_bg = self.render_grid_background(w, h)
+            self._grid_bg_key = key
+        return self._grid_bg
+
+    def render_grid_background(self, w, h):
+        bmp = wx.Bitmap(max(1, w), max(1, h))
+        dc = wx.MemoryDC(bmp)
+
         dc.SetBackground(wx.Brush(BG))
         dc.Clear()
 
-        w, h = self.grid_panel.GetSize()
-
-        left_margin = 40
-        top_margin = 10
-        col_w = 150
+        left_margin = GRID_LEFT_MARGIN
+        top_margin = GRID_TOP_MARGIN
+        col_w = DAY_COL_W
 
-        # Draw day columns
+        # Draw day columns (no list API for rounded rects; one pen/brush for all)
+        dc.SetBrush(wx.Brush(wx.Colour(22, 28, 38)))
+        dc.SetPen(wx.Pen(wx.Colour(44, 54, 68)))
+        day_texts, day_points = [], []
         for col in range(DAY_COL_COUNT):
             x = left_margin + col * (col_w + GRID_COL_GAP)
-
-            dc.SetBrush(wx.Brush(wx.Colour(22, 28, 38)))
-            dc.SetPen(wx.Pen(wx.Colour(44, 54, 68)))
             dc.DrawRoundedRectangle(x, top_margin, col_w, h - 20, 6)
 
             date = self.week_start + datetime.timedelta(days=col)
-            dc.SetFont(wx.Font(10, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD))
-            dc.SetTextForeground(TEXT_LIGHT)
-            dc.DrawText(str(date.day), x + 10, top_margin + 5)
+            day_texts.append(str(date.day))
+            day_points.append((x + 10, top_margin + 5))
 
-        # Draw hour lines
+        dc.SetFont(self.day_font)
+        dc.DrawTextList(day_texts, day_points, TEXT_LIGHT)
+
+        # Draw hour lines + labels in one batch each
+        right = left_margin + (col_w + GRID_COL_GAP) * DAY_COL_COUNT
+        lines, labels, label_points = [], [], []
         for i in range(HOUR_END - HOUR_START + 1):
             y = top_margin + i * HOUR_HEIGHT
-
-            dc.SetPen(wx.Pen(wx.Colour(34, 42, 54)))
-            dc.DrawLine(left_margin, y, left_margin + (col_w + GRID_COL_GAP) * DAY_COL_COUNT, y)
+            lines.append((left_margin, y, right, y))
 
             hour = HOUR_START + i
-            label = f"{(hour - 1) % 12 + 1} {'AM' if hour < 12 else 'PM'}"
+            labels.append(f"{(hour - 1) % 12 + 1} {'AM' if hour < 12 else 'PM'}")
+            label_points.append((left_margin - 40, y - 6))
 
-            dc.SetFont(wx.Font(9, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL))
-            dc.SetTextForeground(wx.Colour(150, 160, 170))
-            dc.DrawText(label, left_margin - 40, y - 6)
+        dc.DrawLineList(lines, wx.Pen(wx.Colour(34, 42, 54)))
+        dc.SetFont(self.hour_font)
+        dc.DrawTextList(labels, label_points, wx.Colour(150, 160, 170))
 
-        # Draw events
-        for ev in self.events:
-            self.draw_event(dc, ev, col_w, left_margin, top_margin)
+        dc.SelectObject(wx.NullBitmap)
+        return bmp
 
-    def draw_event(self, dc, ev, col_w, left_margin, top_margin):
+    def week_events(self):
+        """Events falling inside the displayed week (cached per week and edit)."""
+        key = (self.week_start, self.events_version)
+        if self._week_events_key != key:
+            week_end = self.week_start + datetime.timedelta(days=DAY_COL_COUNT)
+            self._week_events = [ev for ev in self.events
+                                 if self.week_start <= ev["date"] < week_end]
+            self._week_events_key = key
+        return self._week_events
+
+    def week_layout(self):
+        """
+        (event, rect) for the displayed week with overlapping events split
+        into sub-columns; cached like week_events and shared by paint and
+        hit testing.
+        """
+        key = (self.week_start, self.events_version)
+        if self._week_layout_key != key:
+            by_day = {}
+            for ev in self.week_events():
+                by_day.setdefault(ev["date"], []).append((ev, self.event_rect(ev)))
+
+            layout = []
+            for items in by_day.values():
+                spans = [(r.GetTop(), r.GetBottom() + 1) for _, r in items]
+                for (ev, r), (col, cols) in zip(items, overlap_columns(spans)):
+                    if cols > 1:
+                        sub_w = (r.width - SUBCOL_GAP * (cols - 1)) // cols
+                        r = wx.Rect(r.x + col * (sub_w + SUBCOL_GAP), r.y, sub_w, r.height)
+                    layout.append((ev, r))
+
+            self._week_layout = layout
+            self._week_layout_key = key
+        return self._week_layout
+
+    def event_rect(self, ev):
+        """Full-width rounded block of an event on the grid panel."""
         day_idx = (ev["date"] - self.week_start).days
-        if day_idx < 0 or day_idx >= DAY_COL_COUNT:
-            return
 
         s_minutes = ev["start"].hour * 60 + ev["start"].minute
         e_minutes = ev["end"].hour * 60 + ev["end"].minute
         offset = HOUR_START * 60
 
-        y1 = top_margin + int((s_minutes - offset) / 60 * HOUR_HEIGHT)
-        y2 = top_margin + int((e_minutes - offset) / 60 * HOUR_HEIGHT)
+        y1 = GRID_TOP_MARGIN + int((s_minutes - offset) / 60 * HOUR_HEIGHT)
+        y2 = GRID_TOP_MARGIN + int((e_minutes - offset) / 60 * HOUR_HEIGHT)
 
-        x = left_margin + day_idx * (col_w + GRID_COL_GAP) + 6
-        w = col_w - 12
+        x = GRID_LEFT_MARGIN + day_idx * (DAY_COL_W + GRID_COL_GAP) + EVENT_PAD
         h = max(16, y2 - y1)
-
-        if ev.get("completed"):
-            color = wx.Colour(120, 124, 130)
-            text_col = wx.Colour(200, 200, 205)
-        else:
-            color = EVENT_COLORS[ev["color_index"] % len(EVENT_COLORS)]
-            text_col = wx.Colour(10, 10, 10)
-
-        dc.SetBrush(wx.Brush(color))
-        dc.SetPen(wx.Pen(color))
-        dc.DrawRoundedRectangle(x, y1 + 2, w, h - 4, 6)
-
-        dc.SetTextForeground(text_col)
-        dc.SetFont(wx.Font(10, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_BOLD))
-
-        title = ev["title"]
-        max_chars = 18
-        if len(title) > max_chars:
-            title = title[: max_chars - 1] + "…"
-
-        dc.DrawText(title, x + 6, y1 + 8)
-
-        if ev.get("completed"):
-            dc.SetFont(wx.Font(8, wx.FONTFAMILY_SWISS, 0, wx.FONTWEIGHT_NORMAL))
-            dc.SetTextForeground(wx.Colour(170, 170, 175))
-            dc.DrawText("(Completed)", x + 6, y1 + 24)
+        return wx.Rect(x, y1 + 2, DAY_COL_W - 2 * EVENT_PAD, h - 4)
+
+    def draw_events(self, dc, items):
+        """
+        Draw (event, rect) pairs grouped by style: one brush/pen per colour
+        for the blocks, then titles and "(Completed)" notes as text lists.
+        """
+        blocks = {}
+        titles, title_points, title_colours = [], [], []
+        notes, note_points = [], []
+
+        for ev, rect in items:
+            x, y1 = rect.x, rect.y - 2
+            if ev.get("completed"):
+                key = -1
+                title_colours.append(COMPLETED_TEXT)
+                if rect.width >= 80:
+                    notes.append("(Completed)")
+                    note_points.append((x + 6, y1 + 24))
+            else:
+                key = ev["color_index"] % len(EVENT_COLORS)
+                title_colours.append(EVENT_TEXT)
+            blocks.setdefault(key, []).append(rect)
+
+            title = ev["title"]
+            # sub-columns of overlapping events are narrower: fewer characters fit
+            max_chars = max(2, 18 * rect.width // (DAY_COL_W - 2 * EVENT_PAD))
+            if len(title) > max_chars:
+                title = title[: max_chars - 1] + "…"
+            titles.append(title)
+            title_points.append((x + 6, y1 + 8))
+
+        for key, rects in blocks.items():
+            color = COMPLETED_FILL if key < 0 else EVENT_COLORS[key]
+            dc.SetBrush(wx.Brush(color))
+            dc.SetPen(wx.Pen(color))
+            for rect in rects:
+                dc.DrawRoundedRectangle(rect, 6)
+
+        dc.SetFont(self.event_font)
+        dc.DrawTextList(titles, title_points, title_colours)
+        if notes:
+            dc.SetFont(self.event_note_font)
+            dc.DrawTextList(notes, note_points, COMPLETED_NOTE)
 
     # ======================================================
     # EVENT CLICK
@@ -447,28 +616,9 @@ class TasksScreen(wx.Panel):
     def on_grid_click(self, evt):
         pos = evt.GetPosition()
 
-        col_w = 150
-        left_margin = 40
-        top_margin = 10
-
         clicked = None
-        for ev in self.events:
-            day_idx = (ev["date"] - self.week_start).days
-            if day_idx < 0 or day_idx >= DAY_COL_COUNT:
-                continue
-
-            s_minutes = ev["start"].hour * 60 + ev["start"].minute
-            e_minutes = ev["end"].hour * 60 + ev["end"].minute
-            offset = HOUR_START * 60
-
-            y1 = top_margin + int((s_minutes - offset) / 60 * HOUR_HEIGHT)
-            y2 = top_margin + int((e_minutes - offset) / 60 * HOUR_HEIGHT)
-
-            x = left_margin + day_idx * (col_w + GRID_COL_GAP) + 6
-            w = col_w - 12
-            h = max(16, y2 - y1)
-
-            if wx.Rect(x, y1 + 2, w, h - 4).Contains(pos):
+        for ev, rect in self.week_layout():
+            if rect.Contains(pos):
                 clicked = ev
                 break
 
@@ -4,6 +4,8 @@ import os
 import json
 import datetime
 
+from icon_button import bitmap_cache
+
 class ToDoListScreen(wx.Panel):
     def __init__(self, parent, nav_callback=None, back_callback=None):
         super().__init__(parent)
@@ -11,13 +13,15 @@ class ToDoListScreen(wx.Panel):
         self.nav_callback = nav_callback
         self.back_callback = back_callback
 
+        self.base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
         # IMAGE PATHS
-        self.BANNER_PATH_USER = r"D:\StudyAura-'Your Space for Smarter Learning'\assets\themes\bg1.jpg"
-        self.LEAF_PATH_USER   = r"D:\StudyAura-'Your Space for Smarter Learning'\assets\themes\bg2.jpg"
-        self.COFFEE_PATH_USER = r"D:\StudyAura-'Your Space for Smarter Learning'\assets\themes\bg3.jpg"
+        themes_dir = os.path.join(self.base_dir, "assets", "themes")
+        self.BANNER_PATH_USER = os.path.join(themes_dir, "bg1.jpg")
+        self.LEAF_PATH_USER   = os.path.join(themes_dir, "bg2.jpg")
+        self.COFFEE_PATH_USER = os.path.join(themes_dir, "bg3.jpg")
 
         # DATA DIRECTORY
-        self.base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         self.data_dir = os.path.join(self.base_dir, "data")
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
@@ -124,22 +128,31 @@ class ToDoListScreen(wx.Panel):
         self.SetSizer(root_sizer)
 
     # ==================================================================
-    # LOAD IMAGE
+    # LOAD IMAGE — placeholder now, decoded + scaled on a worker thread
     # ==================================================================
     def load_image(self, path, w, h):
-        if os.path.exists(path):
-            img = wx.Image(path, wx.BITMAP_TYPE_ANY)
-            img = img.Scale(w, h, wx.IMAGE_QUALITY_HIGH)
-            return wx.Bitmap(img)
-        return None
+        if not os.path.exists(path):
+            return None
+
+        # sized like the final image, so the layout never shifts
+        widget = wx.StaticBitmap(self.scroll_win, size=(w, h))
+        widget.SetBackgroundColour(self.colors["card_bg"])
+
+        def ready(bitmaps):
+            if widget:       # screen may be gone by the time decoding ends
+                widget.SetBitmap(bitmaps[0])
+
+        # shared, DPI-aware and LRU-bounded (icon_button.bitmap_cache)
+        bitmap_cache.prefetch(path, [(w, h)], self.GetContentScaleFactor(), ready,
+                              quality="high")
+        return widget
 
     # ==================================================================
     # BANNER
     # ==================================================================
     def render_banner(self):
-        bmp = self.load_image(self.BANNER_PATH_USER, 1100, 200)
-        if bmp:
-            banner = wx.StaticBitmap(self.scroll_win, bitmap=bmp)
+        banner = self.load_image(self.BANNER_PATH_USER, 1100, 200)
+        if banner:
             self.main_sizer.Add(banner, 0, wx.ALIGN_CENTER_HORIZONTAL | wx.BOTTOM, 15)
 
     # ==================================================================
@@ -174,9 +187,8 @@ class ToDoListScreen(wx.Panel):
         self.update_clock(None)
 
         # PLANT IMAGE
-        bmp = self.load_image(self.LEAF_PATH_USER, 200, 230)
-        if bmp:
-            leaf_img = wx.StaticBitmap(self.scroll_win, bitmap=bmp)
+        leaf_img = self.load_image(self.LEAF_PATH_USER, 200, 230)
+        if leaf_img:
             left_sizer.Add(leaf_img, 0, wx.ALIGN_CENTER | wx.TOP, 10)
 
     # ==================================================================
@@ -258,6 +270,14 @@ class ToDoListScreen(wx.Panel):
     # ==================================================================
     # EVENTS
     # ==================================================================
+    def suspend(self):
+        # MainFrame keeps this screen alive while hidden; the clock can wait
+        self.timer.Stop()
+
+    def resume(self):
+        self.update_clock(None)
+        self.timer.Start(1000)
+
     def update_clock(self, event):
         now = datetime.datetime.now()
         self.time_lbl.SetLabel(now.strftime("%I:%M %p"))
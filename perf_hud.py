@@ -0,0 +1,237 @@
+# ---------------------------------------------------------
+# perf_hud.py — Frame-time / paint-cost overlay for StudyAura
+# Toggle from MainFrame (F3). Costs nothing while hidden.
+# ---------------------------------------------------------
+
+import time
+from collections import deque
+
+import wx
+
+from animations import animation_policy
+
+HUD_SIZE = (260, 112)
+HUD_MARGIN = 12
+HUD_UPDATE_MS = 500
+PAINT_SAMPLES = 240          # rolling window for avg / p95 paint time
+
+HUD_BG = wx.Colour(8, 10, 14)
+HUD_BORDER = wx.Colour(0, 200, 255)
+HUD_TEXT = wx.Colour(220, 230, 240)
+HUD_WARN = wx.Colour(255, 120, 90)
+FRAME_BUDGET_MS = 16.7
+
+
+# --------------------------------------------------------------------
+# Counters shared by every hooked window of the current screen
+# --------------------------------------------------------------------
+class FrameStats:
+    def __init__(self):
+        self.paint_ms = deque(maxlen=PAINT_SAMPLES)
+        self.reset_interval()
+
+    def reset_interval(self):
+        self.paints = 0
+        self.ticks = 0
+        self.refreshes = 0
+        self.since = time.perf_counter()
+
+    def snapshot(self):
+        """Rates over the interval since the last snapshot, plus paint timings."""
+        dt = max(1e-6, time.perf_counter() - self.since)
+        samples = sorted(self.paint_ms)
+        if samples:
+            avg = sum(samples) / len(samples)
+            p95 = samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+        else:
+            avg = p95 = 0.0
+        snap = {
+            "fps": self.paints / dt,
+            "avg_ms": avg,
+            "p95_ms": p95,
+            "ticks": self.ticks / dt,
+            "refreshes": self.refreshes / dt,
+        }
+        self.reset_interval()
+        return snap
+
+
+# --------------------------------------------------------------------
+# Event handler pushed onto each hooked window
+# --------------------------------------------------------------------
+class _StatsHandler(wx.EvtHandler):
+    """Times EVT_PAINT by forwarding it to the window.
+
+    The window's own handler runs inside on_paint, so its cost is measured;
+    paints the window does not handle are skipped on so native painting
+    still happens. (Timer events go straight to the timer's owner and never
+    reach a pushed handler; ticks are counted by PerfHUD._count_tick.)
+    """
+
+    def __init__(self, window, stats):
+        super().__init__()
+        self.window = window
+        self.stats = stats
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+
+    def _forward(self, evt):
+        if not self.window.ProcessEvent(evt):
+            evt.Skip()
+
+    def on_paint(self, evt):
+        t0 = time.perf_counter()
+        self._forward(evt)
+        self.stats.paint_ms.append((time.perf_counter() - t0) * 1000)
+        self.stats.paints += 1
+
+    def on_destroy(self, evt):
+        # a window must not be destroyed with handlers still pushed
+        if evt.GetEventObject() is self.window:
+            self.window.RemoveEventHandler(self)
+        evt.Skip()
+
+
+def _paint_surfaces(roots):
+    """Roots plus their custom-painted (BG_STYLE_PAINT) descendants."""
+    out = []
+    stack = list(roots)
+    while stack:
+        win = stack.pop()
+        if not win:
+            continue
+        if win in roots or win.GetBackgroundStyle() == wx.BG_STYLE_PAINT:
+            out.append(win)
+        stack.extend(win.GetChildren())
+    return out
+
+
+# --------------------------------------------------------------------
+# CLASS: PerfHUD
+# --------------------------------------------------------------------
+class PerfHUD(wx.Window):
+    """
+    Small overlay in the frame's top-right corner:
+      - FPS (paints/s) of the current screen
+      - Average and p95 paint time
+      - Animation timer ticks/s and Refresh() calls/s
+    Hooks are installed only while the HUD is shown.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent, size=HUD_SIZE)
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+
+        self.stats = FrameStats()
+        self.snap = self.stats.snapshot()
+        self.roots = []
+        self.hooks = []          # (window, _StatsHandler)
+
+        self.font = wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
+
+        self.Hide()
+
+    # ---------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------
+    def toggle(self):
+        if self.IsShown():
+            self.unhook()
+            self.timer.Stop()
+            self.Hide()
+        else:
+            self.place()
+            self.Show()
+            self.Raise()
+            self.hook()
+            self.stats.reset_interval()
+            self.timer.Start(HUD_UPDATE_MS)
+
+    def track(self, roots):
+        """Measure these windows (the active screen) from now on."""
+        self.unhook()
+        self.roots = [w for w in roots if w]
+        if self.IsShown():
+            self.hook()
+            self.place()
+            self.Raise()
+
+    def unhook(self):
+        animation_policy.tick_hook = None
+        for win, handler in self.hooks:
+            if win:
+                win.RemoveEventHandler(handler)
+                try:
+                    del win.Refresh
+                except AttributeError:
+                    pass
+        self.hooks = []
+
+    # ---------------------------------------------------------
+    # Hooks
+    # ---------------------------------------------------------
+    def hook(self):
+        for win in _paint_surfaces(self.roots):
+            handler = _StatsHandler(win, self.stats)
+            win.PushEventHandler(handler)
+            win.Refresh = self._counting_refresh(win.Refresh)
+            self.hooks.append((win, handler))
+        animation_policy.tick_hook = self._count_tick
+
+    def _count_tick(self, owner):
+        # AnimationTimer ticks whose owner sits inside a tracked root
+        win = owner
+        while win:
+            if win in self.roots:
+                self.stats.ticks += 1
+                return
+            win = win.GetParent()
+
+    def _counting_refresh(self, refresh):
+        stats = self.stats
+
+        def counted(*args, **kwargs):
+            stats.refreshes += 1
+            return refresh(*args, **kwargs)
+        return counted
+
+    # ---------------------------------------------------------
+    # Display
+    # ---------------------------------------------------------
+    def place(self):
+        w, _ = self.GetParent().GetClientSize()
+        self.SetPosition((w - HUD_SIZE[0] - HUD_MARGIN, HUD_MARGIN))
+
+    def on_timer(self, evt):
+        self.snap = self.stats.snapshot()
+        self.Raise()
+        self.Refresh(False)
+
+    def on_paint(self, evt):
+        dc = wx.AutoBufferedPaintDC(self)
+        w, h = self.GetSize()
+
+        dc.SetBrush(wx.Brush(HUD_BG))
+        dc.SetPen(wx.Pen(HUD_BORDER))
+        dc.DrawRectangle(0, 0, w, h)
+
+        s = self.snap
+        lines = [
+            (f"FPS        {s['fps']:6.1f}", HUD_TEXT),
+            (f"paint avg  {s['avg_ms']:6.2f} ms", HUD_TEXT),
+            (f"paint p95  {s['p95_ms']:6.2f} ms",
+             HUD_WARN if s["p95_ms"] > FRAME_BUDGET_MS else HUD_TEXT),
+            (f"ticks/s    {s['ticks']:6.1f}", HUD_TEXT),
+            (f"Refresh/s  {s['refreshes']:6.1f}", HUD_TEXT),
+        ]
+
+        dc.SetFont(self.font)
+        y = 8
+        for text, col in lines:
+            dc.SetTextForeground(col)
+            dc.DrawText(text, 10, y)
+            y += 19
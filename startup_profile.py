@@ -0,0 +1,199 @@
+# ---------------------------------------------------------
+# startup_profile.py — Cold-start profiling for StudyAura
+# Enable with `python main.py --profile-startup` or STUDYAURA_PROFILE=1
+# (STUDYAURA_PROFILE may also name the output folder).
+# Costs nothing while disabled.
+# ---------------------------------------------------------
+
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "STUDYAURA_PROFILE"
+PROFILE_FLAG = "--profile-startup"
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+REPORT_TOP_IMPORTS = 25
+
+
+def requested_output_dir(argv=None, environ=None):
+    """Output folder if profiling was asked for, else None."""
+    argv = sys.argv[1:] if argv is None else argv
+    environ = os.environ if environ is None else environ
+
+    if PROFILE_FLAG in argv:
+        return PROFILE_DIR
+    value = environ.get(PROFILE_ENV, "")
+    if value in ("", "0"):
+        return None
+    return PROFILE_DIR if value == "1" else value
+
+
+# --------------------------------------------------------------------
+# Import timing: wraps each module's loader while profiling
+# --------------------------------------------------------------------
+class _TimedLoader:
+    def __init__(self, loader, profiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self.profiler.phase(module.__name__, "import"):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        # resource readers, is_package, get_code… go to the real loader
+        return getattr(self.loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self.profiler)
+            return spec
+        return None
+
+
+# --------------------------------------------------------------------
+# CLASS: StartupProfiler
+# --------------------------------------------------------------------
+class StartupProfiler:
+    """
+    Wall-time spans for startup: one per imported module ("import"), per
+    startup step ("phase"), per background job ("worker") and per first
+    screen import ("screen"), on whichever thread ran them. write_report()
+    saves a text summary and a Chrome trace (chrome://tracing or
+    ui.perfetto.dev); MainFrame rewrites both on close.
+    """
+
+    def __init__(self, out_dir=None):
+        self.out_dir = out_dir
+        self.enabled = out_dir is not None
+        self.t0 = time.perf_counter()
+        self.spans = []           # (name, category, start, end, thread id)
+        self.threads = {}         # thread id -> name
+        self.lock = threading.Lock()
+        self.stem = None          # report path, fixed by the first write
+        self.sections = []        # callables returning extra report text
+
+    def install(self):
+        if self.enabled:
+            sys.meta_path.insert(0, _ImportTimer(self))
+
+    def add(self, name, category, start, end):
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        with self.lock:
+            self.spans.append((name, category, start, end, thread.ident))
+            self.threads[thread.ident] = thread.name
+
+    @contextmanager
+    def phase(self, name, category="phase"):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, time.perf_counter())
+
+    # ---------------------------------------------------------
+    # Report
+    # ---------------------------------------------------------
+    def _import_self_ms(self, imports):
+        """Self time per import span: cumulative minus nested imports."""
+        self_ms = {}
+        stack = []
+        for span in sorted(imports, key=lambda s: (s[4], s[2], -s[3])):
+            while stack and (stack[-1][4] != span[4] or stack[-1][3] <= span[2]):
+                stack.pop()
+            self_ms[span] = (span[3] - span[2]) * 1000
+            if stack:
+                self_ms[stack[-1]] -= (span[3] - span[2]) * 1000
+            stack.append(span)
+        return self_ms
+
+    def text_report(self):
+        with self.lock:
+            spans = list(self.spans)
+        ms = lambda s: (s[3] - s[2]) * 1000
+        at = lambda s: (s[2] - self.t0) * 1000
+
+        lines = ["StudyAura startup profile", ""]
+        first_paint = [s for s in spans if s[0] == "first paint"]
+        if first_paint:
+            lines.append(f"Time to first paint: {(first_paint[0][3] - self.t0) * 1000:.1f} ms")
+            lines.append("")
+
+        lines.append("Phases (start / duration / thread):")
+        for s in sorted((s for s in spans if s[1] != "import"), key=lambda s: s[2]):
+            lines.append(f"  {at(s):9.1f} ms  {ms(s):8.1f} ms  {self.threads[s[4]]:<14} {s[0]}")
+
+        imports = [s for s in spans if s[1] == "import"]
+        self_ms = self._import_self_ms(imports)
+        lines.append("")
+        lines.append(f"Imports: {len(imports)} modules")
+        lines.append(f"Heaviest imports (cumulative / self), top {REPORT_TOP_IMPORTS}:")
+        for s in sorted(imports, key=lambda s: -ms(s))[:REPORT_TOP_IMPORTS]:
+            lines.append(f"  {ms(s):8.1f} ms  {self_ms[s]:8.1f} ms  {s[0]}")
+
+        for section in self.sections:
+            lines.append("")
+            lines.append(section())
+        return "\n".join(lines) + "\n"
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        with self.lock:
+            spans = list(self.spans)
+            threads = dict(self.threads)
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        for name, category, start, end, tid in spans:
+            events.append({
+                "name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                "ts": round((start - self.t0) * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_report(self):
+        """Write startup-<time>.txt and .json to out_dir; later calls update them."""
+        if not self.enabled:
+            return
+        if self.stem is None:
+            self.stem = os.path.join(self.out_dir, time.strftime("startup-%Y%m%d-%H%M%S"))
+        stem = self.stem
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            with open(stem + ".txt", "w", encoding="utf-8") as f:
+                f.write(self.text_report())
+            with open(stem + ".json", "w", encoding="utf-8") as f:
+                json.dump(self.chrome_trace(), f)
+        except OSError as e:
+            print("Startup profile write error:", e)
+            return
+        print("Startup profile written to", stem + ".txt", "and", stem + ".json")
+
+
+profiler = StartupProfiler(requested_output_dir())
+profiler.install()
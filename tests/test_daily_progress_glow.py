@@ -0,0 +1,58 @@
+"""Geometry of the halo pieces DailyProgressScreen blits around session pills."""
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+try:
+    import wx  # noqa: F401
+except ImportError:
+    # the piece geometry is pure Python; only module-level colours need wx
+    sys.modules["wx"] = mock.MagicMock()
+
+from modules.screen_daily_progress import (  # noqa: E402
+    GLOW_WIDTH_STEP, _glow_pill_pieces,
+)
+
+SESSION_H = 40
+OVERDUE_MARGIN = 7      # widest pulsed overdue pad (13) // 2 + 1
+
+
+def _covered(pieces):
+    return [(x, x + w) for x, w, _ in pieces if w > 0]
+
+
+@pytest.mark.parametrize("w", [8, 9, 10, 12, 16, 20, 24, 40, 100, GLOW_WIDTH_STEP])
+def test_pieces_tile_the_whole_halo(w):
+    pieces = _glow_pill_pieces(OVERDUE_MARGIN, GLOW_WIDTH_STEP, w, SESSION_H)
+    spans = _covered(pieces)
+
+    assert spans[0][0] == 0
+    assert spans[-1][1] == w + 2 * OVERDUE_MARGIN
+    for (_, end), (start, _) in zip(spans, spans[1:]):
+        assert end == start
+
+
+@pytest.mark.parametrize("w", [8, 10, 12])
+def test_narrow_pill_keeps_both_caps(w):
+    # split = margin + w - h//2 <= 0 here: the left cap used to be dropped
+    left, right = _glow_pill_pieces(OVERDUE_MARGIN, GLOW_WIDTH_STEP, w, SESSION_H)
+
+    mid = OVERDUE_MARGIN + w // 2
+    assert left == (0, mid, 0)
+    assert right[0] == mid
+    assert right[2] == w - GLOW_WIDTH_STEP
+
+
+def test_wide_pill_splits_where_the_right_cap_starts():
+    w = 120
+    left, right = _glow_pill_pieces(OVERDUE_MARGIN, GLOW_WIDTH_STEP, w, SESSION_H)
+
+    split = OVERDUE_MARGIN + w - SESSION_H // 2
+    assert left == (0, split, 0)
+    assert right == (split, OVERDUE_MARGIN + SESSION_H // 2, w - GLOW_WIDTH_STEP)